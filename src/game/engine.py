@@ -4,7 +4,7 @@ Main game engine for Wiffle Ball Manager
 
 from typing import Optional, Dict, Any
 from rich.console import Console
-from utils.constants import GAME_STATES
+from utils.constants import GAME_STATES, VALID_GAME_STATES
 
 class GameEngine:
     """Main game engine that manages game state and flow"""
@@ -17,7 +17,7 @@ class GameEngine:
         
     def change_state(self, new_state: str) -> None:
         """Change the current game state"""
-        if new_state in GAME_STATES.values():
+        if new_state in VALID_GAME_STATES:
             self.current_state = new_state
         else:
             self.console.print(f"[red]Invalid game state: {new_state}[/red]")
@@ -1,11 +1,16 @@
 """
 Player model for Wiffle Ball Manager (MLW rules)
 """
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, replace
 from typing import Optional, Dict, List
 from copy import deepcopy
 
-@dataclass
+# Stat lines are created for every player, season and game and updated per play, so
+# give them __slots__ where dataclasses support it (Python 3.10+)
+_STAT_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_STAT_SLOTS)
 class BattingStats:
     gp: int = 0   # Games Played
     gs: int = 0   # Games Started
@@ -52,7 +57,7 @@ class BattingStats:
     def calc_ops(self) -> float:
         return round(self.calc_obp + self.calc_slg, 3)
 
-@dataclass
+@dataclass(**_STAT_SLOTS)
 class FieldingStats:
     po: int = 0   # Putouts
     a: int = 0    # Assists
@@ -67,7 +72,7 @@ class FieldingStats:
             return round((self.po + self.a) / denom, 3)
         return 1.0
 
-@dataclass
+@dataclass(**_STAT_SLOTS)
 class PitchingStats:
     gp: int = 0   # Games Pitched
     gs: int = 0   # Games Started
@@ -105,6 +110,55 @@ class PitchingStats:
             return round(self.k / self.bb, 2)
         return float(self.k)
 
+def _add_batting(c: BattingStats, s: BattingStats):
+    """Add one season's batting counting stats into a running total"""
+    c.gp += s.gp
+    c.gs += s.gs
+    c.pa += s.pa
+    c.ab += s.ab
+    c.r += s.r
+    c.h += s.h
+    c.doubles += s.doubles
+    c.triples += s.triples
+    c.hr += s.hr
+    c.rbi += s.rbi
+    c.bb += s.bb
+    c.k += s.k
+    c.hbp += s.hbp
+    c.ibb += s.ibb
+    c.lob += s.lob
+    c.tb += s.tb
+
+def _add_pitching(c: PitchingStats, s: PitchingStats):
+    """Add one season's pitching counting stats into a running total"""
+    c.gp += s.gp
+    c.gs += s.gs
+    c.ip += s.ip
+    c.r += s.r
+    c.er += s.er
+    c.h += s.h
+    c.bb += s.bb
+    c.hbp += s.hbp
+    c.ibb += s.ibb
+    c.k += s.k
+    c.cg += s.cg
+    c.w += s.w
+    c.l += s.l
+    c.s += s.s
+    c.hld += s.hld
+    c.bs += s.bs
+    c.pt += s.pt
+    c.b += s.b
+    c.st += s.st
+    c.wp += s.wp
+
+def _add_fielding(c: FieldingStats, s: FieldingStats):
+    """Add one season's fielding counting stats into a running total"""
+    c.po += s.po
+    c.a += s.a
+    c.e += s.e
+    c.dp += s.dp
+
 @dataclass 
 class CareerStats:
     """Career statistics that track season-by-season and totals"""
@@ -132,58 +186,29 @@ class CareerStats:
     
     def _update_career_batting(self, season_stats: BattingStats):
         """Update career batting totals"""
-        c = self.career_batting
-        s = season_stats
-        c.gp += s.gp
-        c.gs += s.gs
-        c.pa += s.pa
-        c.ab += s.ab
-        c.r += s.r
-        c.h += s.h
-        c.doubles += s.doubles
-        c.triples += s.triples
-        c.hr += s.hr
-        c.rbi += s.rbi
-        c.bb += s.bb
-        c.k += s.k
-        c.hbp += s.hbp
-        c.ibb += s.ibb
-        c.lob += s.lob
-        c.tb += s.tb
+        _add_batting(self.career_batting, season_stats)
     
     def _update_career_pitching(self, season_stats: PitchingStats):
         """Update career pitching totals"""
-        c = self.career_pitching
-        s = season_stats
-        c.gp += s.gp
-        c.gs += s.gs
-        c.ip += s.ip
-        c.r += s.r
-        c.er += s.er
-        c.h += s.h
-        c.bb += s.bb
-        c.hbp += s.hbp
-        c.ibb += s.ibb
-        c.k += s.k
-        c.cg += s.cg
-        c.w += s.w
-        c.l += s.l
-        c.s += s.s
-        c.hld += s.hld
-        c.bs += s.bs
-        c.pt += s.pt
-        c.b += s.b
-        c.st += s.st
-        c.wp += s.wp
+        _add_pitching(self.career_pitching, season_stats)
     
     def _update_career_fielding(self, season_stats: FieldingStats):
         """Update career fielding totals"""
-        c = self.career_fielding
-        s = season_stats
-        c.po += s.po
-        c.a += s.a
-        c.e += s.e
-        c.dp += s.dp
+        _add_fielding(self.career_fielding, season_stats)
+    
+    def batting_totals(self, current: Optional[BattingStats] = None) -> BattingStats:
+        """Career batting totals plus an in-progress season, as a new stat line"""
+        totals = replace(self.career_batting)
+        if current is not None:
+            _add_batting(totals, current)
+        return totals
+    
+    def pitching_totals(self, current: Optional[PitchingStats] = None) -> PitchingStats:
+        """Career pitching totals plus an in-progress season, as a new stat line"""
+        totals = replace(self.career_pitching)
+        if current is not None:
+            _add_pitching(totals, current)
+        return totals
     
     def get_season_stats(self, season: int) -> tuple[BattingStats, PitchingStats, FieldingStats]:
         """Get stats for a specific season"""
@@ -2,7 +2,8 @@
 Team model for Wiffle Ball Manager (MLW rules)
 """
 from dataclasses import dataclass, field
-from typing import List, Optional
+from itertools import chain
+from typing import Iterator, List, Optional
 from .player import Player
 
 @dataclass
@@ -26,6 +27,22 @@ class Team:
     
     # Add more team-level stats as needed
 
+    @property
+    def games_played(self) -> int:
+        """Decided games played (wins + losses)."""
+        return self.wins + self.losses
+
+    @property
+    def pct(self) -> float:
+        """Winning percentage over decided games."""
+        gp = self.games_played
+        return self.wins / gp if gp else 0.0
+
+    @property
+    def run_differential(self) -> int:
+        """Runs scored minus runs allowed."""
+        return self.runs_scored - self.runs_allowed
+
     def add_player(self, player: Player, active: bool = True) -> bool:
         """Add a player to the active or reserve roster."""
         if active and len(self.active_roster) < 6:
@@ -54,6 +71,10 @@ class Team:
         """Return all players on the team (active + reserve)."""
         return self.active_roster + self.reserve_roster
 
+    def iter_players(self) -> Iterator[Player]:
+        """Iterate all players on the team (active, then reserve) without building a list."""
+        return chain(self.active_roster, self.reserve_roster)
+
     def record_game_result(self, runs_scored: int, runs_allowed: int, result: str):
         """Update team record and stats after a game."""
         self.runs_scored += runs_scored
@@ -94,11 +94,14 @@ class AdvancedStatsCalculator:
         total_er = 0
         
         for team in teams:
-            for player in team.get_all_players():
-                if player.batting_stats.ab > 0:
-                    total_obp += player.batting_stats.calc_obp
-                    total_slg += player.batting_stats.calc_slg
-                    total_ops += player.batting_stats.calc_ops
+            for player in team.iter_players():
+                batting = player.batting_stats
+                if batting.ab > 0:
+                    # OPS is OBP + SLG rounded, so reuse them rather than recomputing both
+                    obp, slg = batting.calc_obp, batting.calc_slg
+                    total_obp += obp
+                    total_slg += slg
+                    total_ops += round(obp + slg, 3)
                     total_players += 1
                     
                 if player.pitching_stats.ip > 0:
@@ -211,7 +214,8 @@ class AdvancedStatsCalculator:
     def calculate_defensive_runs_saved(self, player: Player, fielding: FieldingStats, 
                                      position: str = "OF") -> float:
         """Calculate Defensive Runs Saved (simplified for MLW)"""
-        if fielding.po + fielding.a + fielding.e == 0:
+        total_chances = fielding.po + fielding.a + fielding.e
+        if total_chances == 0:
             return 0.0
             
         # Base DRS on fielding percentage and play rate
@@ -222,7 +226,6 @@ class AdvancedStatsCalculator:
         range_factor = (player.range - 50) / 50.0  # Normalize around league average
         
         # Calculate plays made above/below average
-        total_chances = fielding.po + fielding.a + fielding.e
         fpct_diff = actual_fpct - expected_fpct
         
         # DRS calculation (simplified)
@@ -233,7 +236,8 @@ class AdvancedStatsCalculator:
     def calculate_uzr(self, player: Player, fielding: FieldingStats) -> float:
         """Calculate Ultimate Zone Rating (simplified)"""
         # Similar to DRS but focuses more on range and positioning
-        if fielding.po + fielding.a == 0:
+        plays_made = fielding.po + fielding.a
+        if plays_made == 0:
             return 0.0
             
         # Factor in player attributes
@@ -241,7 +245,7 @@ class AdvancedStatsCalculator:
         reaction_factor = (player.reaction - 50) / 50.0
         
         # Base UZR on plays made and player skills
-        base_uzr = (fielding.po + fielding.a) * 0.1
+        base_uzr = plays_made * 0.1
         skill_adjustment = (range_factor + reaction_factor) * 1.5
         
         return round(base_uzr + skill_adjustment, 1)
@@ -4,6 +4,7 @@ Uses advanced statistics to determine season-end awards
 """
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
+from operator import attrgetter
 from models.player import Player
 from models.team import Team
 from simulation.advanced_stats import AdvancedStatsCalculator, LeagueContext
@@ -39,7 +40,7 @@ class AwardsSystem:
         # Calculate advanced stats for all players
         all_players = []
         for team in teams:
-            for player in team.get_all_players():
+            for player in team.iter_players():
                 # Calculate advanced stats
                 batting_advanced, pitching_advanced, fielding_advanced, war = \
                     self.advanced_stats.calculate_all_advanced_stats(player, league_context)
@@ -279,7 +280,7 @@ class AwardsSystem:
         awards = []
         
         # Best Record
-        best_team = max(teams, key=lambda t: t.wins)
+        best_team = max(teams, key=attrgetter("wins"))
         awards.append(TeamAward(
             name="Best Regular Season Record",
             winner=best_team,
@@ -289,16 +290,14 @@ class AwardsSystem:
         
         # Calculate team-wide advanced stats
         for team in teams:
-            team_players = team.get_all_players()
-            if team_players:
-                # Team WAR (sum of all player WARs)
-                team_war = sum(getattr(p, 'war', type('', (), {'total_war': 0})()).total_war 
-                              for p in team_players)
+            if team.active_roster or team.reserve_roster:
+                # Team WAR (sum of all player WARs; players without WAR count as 0)
+                team_war = sum(p.war.total_war for p in team.iter_players() if hasattr(p, 'war'))
                 team.total_war = team_war
         
         # Best Team WAR
         if all(hasattr(team, 'total_war') for team in teams):
-            best_war_team = max(teams, key=lambda t: t.total_war)
+            best_war_team = max(teams, key=attrgetter("total_war"))
             awards.append(TeamAward(
                 name="Best Team WAR",
                 winner=best_war_team,
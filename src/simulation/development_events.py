@@ -6,6 +6,7 @@ import random
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
 class EventType(Enum):
     POSITIVE = "positive"
@@ -16,9 +17,9 @@ class EventSeverity(Enum):
     MODERATE = 2
     MAJOR = 3
 
-@dataclass
+@dataclass(frozen=True)
 class DevelopmentEvent:
-    """Represents a player development event"""
+    """Represents a player development event (read-only: the event tables are shared)"""
     name: str
     description: str
     event_type: EventType
@@ -28,6 +29,12 @@ class DevelopmentEvent:
     duration: int = 0  # How long the effect lasts (0 = permanent)
     requires_conditions: Optional[Dict[str, any]] = None  # Conditions for event to trigger
     
+    def __post_init__(self):
+        # Read-only views, so no draw can change the ranges or conditions for later ones
+        object.__setattr__(self, 'attribute_changes', MappingProxyType(dict(self.attribute_changes)))
+        if self.requires_conditions is not None:
+            object.__setattr__(self, 'requires_conditions', MappingProxyType(dict(self.requires_conditions)))
+    
     def apply_to_player(self, player, season_diary=None):
         """Apply the event effects to a player"""
         changes_made = {}
@@ -49,9 +56,16 @@ class DevelopmentEvent:
 class DevelopmentEventSystem:
     """Manages the enhanced player development events system"""
     
+    # (positive, negative) event tables, built by the first instance and shared after
+    _event_tables: Optional[Tuple[Tuple[DevelopmentEvent, ...], Tuple[DevelopmentEvent, ...]]] = None
+    
     def __init__(self):
-        self.positive_events = self._create_positive_events()
-        self.negative_events = self._create_negative_events()
+        # Looked up in the class's own __dict__ so a subclass with its own tables builds them
+        cls = type(self)
+        tables = cls.__dict__.get('_event_tables')
+        if tables is None:
+            tables = cls._event_tables = (tuple(self._create_positive_events()), tuple(self._create_negative_events()))
+        self.positive_events, self.negative_events = tables
         
     def _create_positive_events(self) -> List[DevelopmentEvent]:
         """Create weighted table of positive development events"""
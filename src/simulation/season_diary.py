@@ -2,10 +2,12 @@
 Season diary system for logging events and activities throughout the season
 Provides a chronological record for UI display
 """
+import heapq
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
 
 class DiaryEntryType(Enum):
     DEVELOPMENT_EVENT = "development_event"
@@ -55,6 +57,9 @@ class DiaryEntry:
         
         return f"{context}{self.description}"
 
+# Sort key for chronological diary order
+_by_timestamp = attrgetter("timestamp")
+
 class SeasonDiary:
     """Manages the season diary system for logging events"""
     
@@ -307,7 +312,7 @@ class SeasonDiary:
     
     def get_recent_entries(self, limit: int = 20) -> List[DiaryEntry]:
         """Get the most recent entries"""
-        return sorted(self.entries, key=lambda x: x.timestamp, reverse=True)[:limit]
+        return heapq.nlargest(limit, self.entries, key=_by_timestamp)
     
     def get_high_priority_entries(self) -> List[DiaryEntry]:
         """Get all high priority entries"""
@@ -346,7 +351,7 @@ class SeasonDiary:
     
     def export_diary_text(self) -> str:
         """Export the entire diary as formatted text"""
-        sorted_entries = sorted(self.entries, key=lambda x: x.timestamp)
+        sorted_entries = sorted(self.entries, key=_by_timestamp)
         
         text = f"Season {self.season_number} Diary\n"
         text += "=" * 40 + "\n\n"
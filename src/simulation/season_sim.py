@@ -8,7 +8,15 @@ from models.game import Game, GameResult
 from models.player import Player, BattingStats, PitchingStats
 from simulation.game_sim import GameSimulator
 from simulation.season_diary import SeasonDiary
+from utils.constants import LEADER_MIN_AB, LEADER_MIN_IP
+import heapq
 import random
+from operator import attrgetter, itemgetter
+
+# Sort key for playoff seeding and draft order
+_by_wins = attrgetter("wins")
+# Standings order, as on the team management standings screen
+_by_standing = attrgetter("pct", "wins", "run_differential")
 
 class SeasonSimulator:
     def __init__(self, teams: List[Team], current_season: int = 1):
@@ -90,11 +98,10 @@ class SeasonSimulator:
             print(f"[WARNING] {team.name} has no available pitchers for series {series_id}, using {least_used.name}")
             return least_used
         
-        # Sort by skill (velocity + control), then by games pitched (prefer less used)
-        available_pitchers.sort(key=lambda x: (x[1], -(x[0].velocity + x[0].control)))
-        
-        selected_pitcher = available_pitchers[0][0]
-        games_pitched = available_pitchers[0][1]
+        # Least used first, then best skill (velocity + control); only the front is needed
+        selected_pitcher, games_pitched = min(
+            available_pitchers, key=lambda x: (x[1], -(x[0].velocity + x[0].control))
+        )
         
         # Log pitcher selection for debugging
         if games_pitched > 0:
@@ -177,7 +184,7 @@ class SeasonSimulator:
         print("Regular season complete! Playing playoffs...")
         
         # Store regular season standings before playoffs
-        regular_season_standings = sorted(self.teams, key=lambda t: t.wins, reverse=True)
+        regular_season_standings = sorted(self.teams, key=_by_wins, reverse=True)
         
         # Reset team records for playoffs (so playoff games don't affect regular season standings)
         for team in self.teams:
@@ -185,7 +192,7 @@ class SeasonSimulator:
             team.playoff_losses = 0
         
         # After season, sort teams by regular season wins for playoffs
-        self.teams.sort(key=lambda t: t.wins, reverse=True)
+        self.teams.sort(key=_by_wins, reverse=True)
         self.play_playoffs()
         self.show_season_leaders()
         
@@ -287,22 +294,20 @@ class SeasonSimulator:
         print("\n=== SEASON LEADERS ===")
         
         # Collect all players from all teams
-        all_players = []
-        for team in self.teams:
-            all_players.extend(team.get_all_players())
+        all_players = [player for team in self.teams for player in team.iter_players()]
         
-        # HITTING LEADERS (min 33 at-bats)
+        # HITTING LEADERS (same at-bat qualifier as the team leader boards)
         qualified_hitters = []
         for player in all_players:
             if hasattr(player, 'batting_stats') and player.batting_stats:
-                at_bats = player.batting_stats.h + player.batting_stats.k  # hits + strikeouts
-                if at_bats >= 33:
-                    avg = player.batting_stats.h / at_bats if at_bats > 0 else 0.0
+                at_bats = player.batting_stats.ab
+                if at_bats >= LEADER_MIN_AB:
+                    avg = player.batting_stats.avg
                     # Use actual tracked RBIs
                     rbi = player.batting_stats.rbi
                     qualified_hitters.append({
                         'player': player,
-                        'team': next((team.name for team in self.teams if player in team.get_all_players()), 'Unknown'),
+                        'team': next((team.name for team in self.teams if player in team.iter_players()), 'Unknown'),
                         'avg': avg,
                         'hr': player.batting_stats.hr,
                         'rbi': rbi,
@@ -310,20 +315,16 @@ class SeasonSimulator:
                         'at_bats': at_bats
                     })
         
-        # PITCHING LEADERS (min 5 games pitched, min innings based on season length for ERA)
+        # PITCHING LEADERS (min 5 games pitched; ERA also needs the team boards' innings qualifier)
         qualified_pitchers = []
-        # Calculate minimum innings based on season length (roughly half the season games)
-        season_games = len(self.teams) * 3  # Each team plays every other team 3 times
-        min_innings = max(5, season_games // 2)  # At least 5 innings, or roughly half season games
         
         for player in all_players:
             if hasattr(player, 'pitching_stats') and player.pitching_stats and player.pitching_stats.gp >= 5:
-                # Calculate ERA (simplified: earned runs per game)
-                era = player.pitching_stats.er / player.pitching_stats.gp if player.pitching_stats.gp > 0 else 999.0
+                era = player.pitching_stats.era
                 
                 qualified_pitchers.append({
                     'player': player,
-                    'team': next((team.name for team in self.teams if player in team.get_all_players()), 'Unknown'),
+                    'team': next((team.name for team in self.teams if player in team.iter_players()), 'Unknown'),
                     'era': era,
                     'wins': player.pitching_stats.w,
                     'k': player.pitching_stats.k,
@@ -336,38 +337,38 @@ class SeasonSimulator:
         
         # Batting Average King
         if qualified_hitters:
-            avg_leader = max(qualified_hitters, key=lambda x: x['avg'])
+            avg_leader = max(qualified_hitters, key=itemgetter('avg'))
             print(f"Batting Average King: {avg_leader['player'].name} ({avg_leader['team']}) - {avg_leader['avg']:.3f}")
         
         # Home Run King
         if qualified_hitters:
-            hr_leader = max(qualified_hitters, key=lambda x: x['hr'])
+            hr_leader = max(qualified_hitters, key=itemgetter('hr'))
             print(f"Home Run King: {hr_leader['player'].name} ({hr_leader['team']}) - {hr_leader['hr']} HR")
         
         # RBI Leader
         if qualified_hitters:
-            rbi_leader = max(qualified_hitters, key=lambda x: x['rbi'])
+            rbi_leader = max(qualified_hitters, key=itemgetter('rbi'))
             print(f"RBI Leader: {rbi_leader['player'].name} ({rbi_leader['team']}) - {rbi_leader['rbi']} RBI")
         
         # Display Pitching Leaders
         print("\n⚾ PITCHING LEADERS ⚾")
         
-        # ERA Leader (lowest ERA, min innings based on season length)
-        era_qualified = [p for p in qualified_pitchers if p['ip'] >= min_innings]
+        # ERA Leader (lowest ERA among pitchers with enough innings)
+        era_qualified = [p for p in qualified_pitchers if p['ip'] >= LEADER_MIN_IP]
         if era_qualified:
-            era_leader = min(era_qualified, key=lambda x: x['era'])
+            era_leader = min(era_qualified, key=itemgetter('era'))
             print(f"ERA Leader: {era_leader['player'].name} ({era_leader['team']}) - {era_leader['era']:.2f} ERA")
         else:
-            print(f"ERA Leader: No qualified pitchers (min {min_innings} IP)")
+            print(f"ERA Leader: No qualified pitchers (min {LEADER_MIN_IP} IP)")
         
         # Wins Leader
         if qualified_pitchers:
-            wins_leader = max(qualified_pitchers, key=lambda x: x['wins'])
+            wins_leader = max(qualified_pitchers, key=itemgetter('wins'))
             print(f"Wins Leader: {wins_leader['player'].name} ({wins_leader['team']}) - {wins_leader['wins']} W")
         
         # Strikeout King
         if qualified_pitchers:
-            k_leader = max(qualified_pitchers, key=lambda x: x['k'])
+            k_leader = max(qualified_pitchers, key=itemgetter('k'))
             print(f"Strikeout King: {k_leader['player'].name} ({k_leader['team']}) - {k_leader['k']} K")
         
         # Rookie of the Year Award
@@ -395,7 +396,7 @@ class SeasonSimulator:
         for rookie in rookies:
             value = self.calculate_rookie_value(rookie)
             if value > 0:  # Only include rookies with meaningful contributions
-                team_name = next((team.name for team in self.teams if rookie in team.get_all_players()), 'Unknown')
+                team_name = next((team.name for team in self.teams if rookie in team.iter_players()), 'Unknown')
                 rookie_candidates.append({
                     'player': rookie,
                     'team': team_name,
@@ -408,8 +409,8 @@ class SeasonSimulator:
             print("No qualified rookie candidates this season")
             return
         
-        # Sort by total value (highest first)
-        rookie_candidates.sort(key=lambda x: x['value'], reverse=True)
+        # Only the winner and two runners-up are shown, so take the top 3 (highest first)
+        rookie_candidates = heapq.nlargest(3, rookie_candidates, key=itemgetter('value'))
         
         # Award winner
         winner = rookie_candidates[0]
@@ -514,7 +515,7 @@ class SeasonSimulator:
     def conduct_rookie_draft(self, rounds: int = 2):
         """Conduct a rookie draft with the lowest-ranked teams picking first. Rookies can be hitter-only, pitcher-only, or two-way."""
         num_teams = len(self.teams)
-        draft_order = sorted(self.teams, key=lambda t: t.wins)  # Lowest wins pick first
+        draft_order = sorted(self.teams, key=_by_wins)  # Lowest wins pick first
         for rnd in range(1, rounds+1):
             print(f"\nRookie Draft - Round {rnd}")
             for team in draft_order:
@@ -524,18 +525,15 @@ class SeasonSimulator:
 
     def select_pitcher(self, team: Team) -> Optional[Player]:
         """Selects the most appropriate pitcher considering fatigue."""
-        # Sort pitchers by lowest combined fatigue
-        pitchers = sorted(
-            [p for p in team.active_roster if p.pitching_stats],
-            key=lambda p: (p.season_fatigue + p.game_fatigue, -p.stamina)
-        )
+        # Select the pitcher with the lowest combined fatigue that may still pitch
+        rested = [
+            p for p in team.active_roster
+            if p.pitching_stats and p.season_fatigue + p.game_fatigue < 0.7  # Threshold for allowing player to pitch
+        ]
+        if not rested:
+            return None  # No available pitcher without high fatigue
 
-        # Select the pitcher with the lowest fatigue
-        for pitcher in pitchers:
-            if pitcher.season_fatigue + pitcher.game_fatigue < 0.7:  # Threshold for allowing player to pitch
-                return pitcher
-
-        return None  # No available pitcher without high fatigue
+        return min(rested, key=lambda p: (p.season_fatigue + p.game_fatigue, -p.stamina))
 
     def generate_realistic_rookie(self):
         """Generate a rookie as hitter-only, pitcher-only, or two-way, with appropriate attributes."""
@@ -618,7 +616,7 @@ class SeasonSimulator:
         print("="*60)
         
         # Get draft order (worst teams pick first)
-        draft_order = sorted(self.teams, key=lambda t: t.wins)
+        draft_order = sorted(self.teams, key=_by_wins)
         
         # Generate draft prospects (mix of rookies and veterans)
         draft_prospects = self.generate_draft_prospects(len(self.teams))
@@ -756,21 +754,8 @@ class SeasonSimulator:
     
     def find_worst_player(self, team):
         """Find the worst player on a team based on overall value"""
-        all_players = team.get_all_players()
-        if not all_players:
-            return None
-        
-        # Calculate value for each player and find the worst
-        worst_player = None
-        worst_value = float('inf')
-        
-        for player in all_players:
-            value = self.calculate_player_value(player)
-            if value < worst_value:
-                worst_value = value
-                worst_player = player
-        
-        return worst_player
+        # Lowest value wins; min() keeps the first of equally valued players
+        return min(team.iter_players(), key=self.calculate_player_value, default=None)
     
     def calculate_player_value(self, player):
         """Calculate a player's overall value (simplified version of trading system)"""
@@ -787,15 +772,17 @@ class SeasonSimulator:
         # Performance factor
         performance_factor = 1.0
         if hasattr(player, 'batting_stats') and player.batting_stats and player.batting_stats.ab > 0:
-            if player.batting_stats.avg > 0.300:
+            avg = player.batting_stats.avg
+            if avg > 0.300:
                 performance_factor += 0.2
-            elif player.batting_stats.avg < 0.200:
+            elif avg < 0.200:
                 performance_factor -= 0.2
         
         if hasattr(player, 'pitching_stats') and player.pitching_stats and player.pitching_stats.ip > 0:
-            if player.pitching_stats.era < 2.0:
+            era = player.pitching_stats.era
+            if era < 2.0:
                 performance_factor += 0.2
-            elif player.pitching_stats.era > 5.0:
+            elif era > 5.0:
                 performance_factor -= 0.2
         
         # Retirement risk
@@ -819,8 +806,8 @@ class SeasonSimulator:
         return None
     
     def get_standings(self):
-        """Get current standings sorted by wins"""
-        return sorted(self.teams, key=lambda t: t.wins, reverse=True)
+        """Get current standings sorted by PCT, then wins, then run differential"""
+        return sorted(self.teams, key=_by_standing, reverse=True)
     
     def get_remaining_schedule(self, team):
         """Get remaining schedule for a team"""
@@ -889,14 +876,14 @@ class SeasonSimulator:
         return {
             "new_season": self.current_season,
             "retired_players": retired_players,
-            "total_active_players": sum(len(team.get_all_players()) for team in self.teams),
+            "total_active_players": sum(len(team.active_roster) + len(team.reserve_roster) for team in self.teams),
             "draft_completed": True
         }
     
     def complete_season_for_all_players(self):
         """Archive current season stats for all players"""
         for team in self.teams:
-            for player in team.get_all_players():
+            for player in team.iter_players():
                 player.complete_season(self.current_season)
                 player.reset_season_stats()
     
@@ -907,7 +894,7 @@ class SeasonSimulator:
         for team in self.teams:
             players_to_remove = []
             
-            for player in team.get_all_players():
+            for player in team.iter_players():
                 # Age the player
                 player.age += 1
                 
@@ -0,0 +1,138 @@
+"""
+Numeric kernels for stat leader tables in Wiffle Ball Manager
+"""
+from functools import cached_property
+from itertools import chain
+import numpy as np
+
+
+# Below this many keys one stable argsort beats argpartition's extra passes
+_PARTITION_MIN_KEYS = 512
+
+
+def _top_n(keys: np.ndarray, n: int) -> np.ndarray:
+    """
+    Indices of the n smallest keys, ordered like sorted(...)[:n]
+    
+    For large inputs argpartition finds the cutoff in O(N); only the candidates at
+    or below it are sorted, and ties keep their original order as with a stable
+    sort. Small inputs (a typical league) are simply sorted.
+    """
+    if len(keys) > max(n, _PARTITION_MIN_KEYS):
+        cutoff = keys[np.argpartition(keys, n - 1)[:n]].max()
+        candidates = np.flatnonzero(keys <= cutoff)
+        return candidates[np.argsort(keys[candidates], kind="stable")][:n]
+    return np.argsort(keys, kind="stable")[:n]
+
+
+def top_n_desc(values: np.ndarray, n: int = 10) -> np.ndarray:
+    """Indices of the n largest values (highest first)"""
+    return _top_n(-values, n)
+
+
+def top_n_asc(values: np.ndarray, n: int = 10) -> np.ndarray:
+    """Indices of the n smallest values (lowest first)"""
+    return _top_n(values, n)
+
+
+def _text_or_na(spec: str, values: np.ndarray, gate: np.ndarray) -> list:
+    """Format ``values`` with ``spec`` where ``gate`` is set and "N/A" elsewhere"""
+    text = np.full(len(values), "N/A", dtype=object)
+    text[gate] = np.char.mod(spec, values[gate]).tolist()
+    return text.tolist()
+
+
+def standings_order(teams) -> tuple:
+    """
+    Standings order and formatted PCT for a list of teams
+    
+    Returns (order, pct_text): team indices sorted by ``Team.pct``, then wins, then
+    run differential (stable, like sorted()), and each team's PCT formatted to three
+    places. PCT is read once and used for both.
+    """
+    wins = np.array([t.wins for t in teams], dtype=np.int64)
+    run_diff = np.array([t.run_differential for t in teams], dtype=np.int64)
+    pct = np.fromiter((t.pct for t in teams), dtype=np.float64, count=len(teams))
+    # lexsort is stable and sorts by the last key first
+    return np.lexsort((-run_diff, -wins, -pct)).tolist(), np.char.mod("%.3f", pct).tolist()
+
+
+class StatIndex:
+    """
+    Column-oriented (SoA) snapshot of league player stats
+    
+    Each stat lives in one contiguous array, built the first time it is read,
+    so leader filters and top-N selection run over arrays; only the selected
+    rows are mapped back to Player objects via ``players``.
+    """
+    
+    def __init__(self, players):
+        self.players = list(players)
+    
+    def _column(self, values, dtype) -> np.ndarray:
+        """One stat per player as an array; columns are cached on first access,
+        so a screen only pays for the stats it shows"""
+        return np.fromiter(values, dtype=dtype, count=len(self.players))
+    
+    # Batting
+    @cached_property
+    def ab(self) -> np.ndarray:
+        return self._column((p.batting_stats.ab for p in self.players), np.int64)
+    
+    @cached_property
+    def avg(self) -> np.ndarray:
+        return self._column((p.batting_stats.avg for p in self.players), np.float64)
+    
+    # Pitching
+    @cached_property
+    def ip(self) -> np.ndarray:
+        return self._column((p.pitching_stats.ip for p in self.players), np.float64)
+    
+    @cached_property
+    def era(self) -> np.ndarray:
+        return self._column((p.pitching_stats.era for p in self.players), np.float64)
+    
+    # Fielding: chances and FPCT come from one pass over the fielding lines
+    @cached_property
+    def _fielding(self) -> np.ndarray:
+        fielding = (p.fielding_stats for p in self.players)
+        return self._column(
+            ((f.po + f.a + f.e, f.calc_fpct) for f in fielding),
+            [("chances", np.int64), ("fpct", np.float64)]
+        )
+    
+    @property
+    def chances(self) -> np.ndarray:
+        return self._fielding["chances"]
+    
+    @property
+    def fpct(self) -> np.ndarray:
+        return self._fielding["fpct"]
+    
+    @classmethod
+    def from_teams(cls, teams) -> "StatIndex":
+        """Build an index over every rostered player (active then reserve, team by team)"""
+        return cls(chain.from_iterable(
+            roster for team in teams for roster in (team.active_roster, team.reserve_roster)
+        ))
+    
+    def avg_text(self, rows=None) -> list:
+        """AVG column formatted for tables, "N/A" for players without at-bats"""
+        ab, avg = (self.ab, self.avg) if rows is None else (self.ab[rows], self.avg[rows])
+        return _text_or_na("%.3f", avg, ab > 0)
+    
+    def era_text(self, rows=None) -> list:
+        """ERA column formatted for tables, "N/A" for players without innings pitched"""
+        ip, era = (self.ip, self.era) if rows is None else (self.ip[rows], self.era[rows])
+        return _text_or_na("%.2f", era, ip > 0)
+    
+    def fpct_text(self, rows=None) -> list:
+        """FPCT column formatted to three places"""
+        fpct = self.fpct if rows is None else self.fpct[rows]
+        return np.char.mod("%.3f", fpct).tolist()
+    
+    def leader_rows(self, values: np.ndarray, mask: np.ndarray, n: int = 10, descending: bool = True) -> np.ndarray:
+        """Row indices of the top-n ``values`` among rows where ``mask`` is set"""
+        rows = np.flatnonzero(mask)
+        pick = top_n_desc(values[rows], n) if descending else top_n_asc(values[rows], n)
+        return rows[pick]
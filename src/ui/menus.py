@@ -2,10 +2,13 @@
 Menu system for Wiffle Ball Manager
 """
 
+import heapq
+from operator import attrgetter, itemgetter
 from typing import List, Callable, Optional
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
+from rich.style import Style
 from rich.table import Table
 from src.utils.constants import GAME_STATES, COLORS
 
@@ -18,6 +21,12 @@ from src.simulation.game_sim import GameSimulator
 from src.ui.team_management import TeamManagementUI
 import random
 
+# Menu styles parsed once at import rather than looked up and re-parsed on every redraw
+_S_TITLE = Style.parse(COLORS["TITLE"])
+_S_HIGHLIGHT = Style.parse(COLORS["HIGHLIGHT"])
+_S_INFO = Style.parse(COLORS["INFO"])
+_S_DIM = Style.parse(COLORS["DIM"])
+
 class MenuItem:
     """Represents a menu item"""
     
@@ -42,12 +51,13 @@ class BaseMenu:
     
     def display(self):
         """Display the menu"""
-        self.console.clear()
+        if self.console.is_terminal:  # Nothing to clear when output is redirected
+            self.console.clear()
         
         # Create title panel
         title_panel = Panel(
             self.title,
-            border_style=COLORS["TITLE"],
+            border_style=_S_TITLE,
             padding=(1, 2)
         )
         self.console.print(title_panel)
@@ -55,9 +65,9 @@ class BaseMenu:
         
         # Create menu table
         table = Table(show_header=False, box=None)
-        table.add_column("Key", style=COLORS["HIGHLIGHT"])
-        table.add_column("Option", style=COLORS["INFO"])
-        table.add_column("Description", style=COLORS["DIM"])
+        table.add_column("Key", style=_S_HIGHLIGHT)
+        table.add_column("Option", style=_S_INFO)
+        table.add_column("Description", style=_S_DIM)
         
         for item in self.items:
             table.add_row(item.key, item.label, item.description)
@@ -384,7 +394,7 @@ class MainMenu(BaseMenu):
         panel = Panel(
             help_text,
             title="Help & Rules",
-            border_style=COLORS["INFO"],
+            border_style=_S_INFO,
             padding=(1, 2)
         )
         
@@ -431,12 +441,8 @@ class SeasonMenu(BaseMenu):
         selected_team = team_ui.select_team_to_view(teams)
         
         if selected_team:
-            # Show team overview
-            team_ui.show_team_overview(selected_team)
-            
-            # Show full roster with stats
-            self.console.print("\n")
-            team_ui.show_roster(selected_team, show_reserves=True)
+            # Show team overview and full roster with stats as one screen
+            team_ui.show_team_screen(selected_team)
             
             # Allow player selection for detailed view
             while True:
@@ -447,10 +453,8 @@ class SeasonMenu(BaseMenu):
                     team_ui.show_player_details(selected_player, current_season)
                     Prompt.ask("\nPress Enter to return to roster")
                     
-                    # Redisplay roster
-                    team_ui.show_team_overview(selected_team)
-                    self.console.print("\n")
-                    team_ui.show_roster(selected_team, show_reserves=True)
+                    # Redisplay team overview and roster
+                    team_ui.show_team_screen(selected_team)
                 else:
                     # User chose to go back
                     break
@@ -516,7 +520,7 @@ class SeasonMenu(BaseMenu):
             "season_simulator": self._serialize_season_sim(season_sim),
             "game_metadata": {
                 "total_teams": len(teams),
-                "total_players": sum(len(team.get_all_players()) for team in teams),
+                "total_players": sum(len(team.active_roster) + len(team.reserve_roster) for team in teams),
                 "current_game": self.engine.get_game_data("current_game", 1),
                 "current_series": self.engine.get_game_data("current_series", 1)
             }
@@ -557,7 +561,7 @@ class SeasonMenu(BaseMenu):
             }
             
             # Serialize all players
-            for player in team.get_all_players():
+            for player in team.iter_players():
                 player_data = {
                     "name": player.name,
                     "age": player.age,
@@ -705,9 +709,8 @@ class SeasonMenu(BaseMenu):
             table.add_column("PCT", style="blue")
             
             for i, team in enumerate(standings, 1):
-                games_played = team.wins + team.losses
-                pct = f"{team.wins / games_played:.3f}" if games_played > 0 else ".000"
-                table.add_row(str(i), team.name, team.division, str(games_played), str(team.wins), str(team.losses), pct)
+                pct = f"{team.pct:.3f}".lstrip("0")
+                table.add_row(str(i), team.name, team.division, str(team.games_played), str(team.wins), str(team.losses), pct)
             
             self.console.print(table)
             Prompt.ask("\nPress Enter to continue")
@@ -747,7 +750,8 @@ class SeasonMenu(BaseMenu):
         
         # Display diary menu
         while True:
-            self.console.clear()
+            if self.console.is_terminal:
+                self.console.clear()
             self.console.print(f"[bold cyan]Season {diary.season_number} Diary[/bold cyan]\n")
             
             # Show summary statistics
@@ -811,18 +815,19 @@ class SeasonMenu(BaseMenu):
     
     def show_diary_entries(self, entries, title):
         """Display a list of diary entries"""
-        self.console.clear()
+        if self.console.is_terminal:
+            self.console.clear()
         
         if not entries:
             self.console.print(f"[yellow]No {title.lower()} to display.[/yellow]")
             Prompt.ask("\nPress Enter to continue")
             return
         
-        # Sort entries by timestamp (most recent first)
-        sorted_entries = sorted(entries, key=lambda x: x.timestamp, reverse=True)
+        # Most recent entries first, limited to 50 for display
+        recent_entries = heapq.nlargest(50, entries, key=attrgetter('timestamp'))
         
         self.console.print(f"[bold cyan]{title}[/bold cyan]")
-        self.console.print(f"Total entries: {len(sorted_entries)}\n")
+        self.console.print(f"Total entries: {len(entries)}\n")
         
         # Create entries table
         entries_table = Table()
@@ -830,7 +835,7 @@ class SeasonMenu(BaseMenu):
         entries_table.add_column("Event", style="white", width=50)
         entries_table.add_column("Priority", style="yellow", width=8)
         
-        for entry in sorted_entries[:50]:  # Limit to 50 entries for display
+        for entry in recent_entries:
             priority_display = {
                 1: "Low",
                 2: "Medium", 
@@ -909,7 +914,7 @@ class SeasonMenu(BaseMenu):
         # Collect all players with batting stats
         all_batters = []
         for team in teams:
-            for player in team.get_all_players():
+            for player in team.iter_players():
                 if hasattr(player, 'batting_stats') and player.batting_stats:
                     # Calculate at-bats (hits + strikeouts + other outs)
                     at_bats = player.batting_stats.h + player.batting_stats.k + (player.batting_stats.ab - player.batting_stats.h - player.batting_stats.k)
@@ -932,7 +937,7 @@ class SeasonMenu(BaseMenu):
                         })
         
         # Sort by batting average (descending)
-        all_batters.sort(key=lambda x: x['avg'], reverse=True)
+        all_batters.sort(key=itemgetter('avg'), reverse=True)
         
         # Create batting stats table
         table = Table(title="Batting Statistics")
@@ -948,20 +953,15 @@ class SeasonMenu(BaseMenu):
         table.add_column("K", style="red", width=4)
         table.add_column("AB", style="blue", width=4)
         
-        for i, batter in enumerate(all_batters, 1):
-            table.add_row(
-                str(i),
-                batter['player'].name,
-                batter['team'],
-                f"{batter['avg']:.3f}",
-                f"{batter['obp']:.3f}",
-                str(batter['h']),
-                str(batter['hr']),
-                str(batter['rbi']),
-                str(batter['bb']),
-                str(batter['k']),
-                str(batter['ab'])
-            )
+        # Format every row first, then fill the table
+        rows = [
+            (str(i), batter['player'].name, batter['team'], f"{batter['avg']:.3f}", f"{batter['obp']:.3f}",
+             str(batter['h']), str(batter['hr']), str(batter['rbi']), str(batter['bb']), str(batter['k']),
+             str(batter['ab']))
+            for i, batter in enumerate(all_batters, 1)
+        ]
+        for row in rows:
+            table.add_row(*row)
         
         self.console.print(table)
     
@@ -972,7 +972,7 @@ class SeasonMenu(BaseMenu):
         # Collect all players with pitching stats
         all_pitchers = []
         for team in teams:
-            for player in team.get_all_players():
+            for player in team.iter_players():
                 if hasattr(player, 'pitching_stats') and player.pitching_stats and player.pitching_stats.gp > 0:
                     # Calculate ERA (earned runs per 6 innings, since MLW games are 3 innings)
                     era = (player.pitching_stats.er * 6) / player.pitching_stats.ip if player.pitching_stats.ip > 0 else 999.0
@@ -994,7 +994,7 @@ class SeasonMenu(BaseMenu):
                     })
         
         # Sort by ERA (ascending - lower is better)
-        all_pitchers.sort(key=lambda x: x['era'])
+        all_pitchers.sort(key=itemgetter('era'))
         
         # Create pitching stats table
         table = Table(title="Pitching Statistics")
@@ -1010,20 +1010,15 @@ class SeasonMenu(BaseMenu):
         table.add_column("IP", style="blue", width=5)
         table.add_column("GP", style="blue", width=4)
         
-        for i, pitcher in enumerate(all_pitchers, 1):
-            table.add_row(
-                str(i),
-                pitcher['player'].name,
-                pitcher['team'],
-                f"{pitcher['era']:.2f}",
-                f"{pitcher['whip']:.2f}",
-                str(pitcher['w']),
-                str(pitcher['l']),
-                str(pitcher['k']),
-                str(pitcher['bb']),
-                f"{pitcher['ip']:.1f}",
-                str(pitcher['gp'])
-            )
+        # Format every row first, then fill the table
+        rows = [
+            (str(i), pitcher['player'].name, pitcher['team'], f"{pitcher['era']:.2f}", f"{pitcher['whip']:.2f}",
+             str(pitcher['w']), str(pitcher['l']), str(pitcher['k']), str(pitcher['bb']), f"{pitcher['ip']:.1f}",
+             str(pitcher['gp']))
+            for i, pitcher in enumerate(all_pitchers, 1)
+        ]
+        for row in rows:
+            table.add_row(*row)
         
         self.console.print(table)
     
@@ -1046,9 +1041,8 @@ class SeasonMenu(BaseMenu):
             table.add_column("PCT", style="blue")
             
             for i, team in enumerate(results["standings"], 1):
-                games_played = team.wins + team.losses
-                pct = f"{team.wins / games_played:.3f}" if games_played > 0 else ".000"
-                table.add_row(str(i), team.name, str(games_played), str(team.wins), str(team.losses), pct)
+                pct = f"{team.pct:.3f}".lstrip("0")
+                table.add_row(str(i), team.name, str(team.games_played), str(team.wins), str(team.losses), pct)
             
             self.console.print(table)
         
@@ -1071,7 +1065,7 @@ class SeasonMenu(BaseMenu):
         
         # Show current season info
         current_season = season_sim.current_season
-        total_players = sum(len(team.get_all_players()) for team in teams)
+        total_players = sum(len(team.active_roster) + len(team.reserve_roster) for team in teams)
         
         self.console.print(f"\n[yellow]Current Season: {current_season}[/yellow]")
         self.console.print(f"[yellow]Total Active Players: {total_players}[/yellow]")
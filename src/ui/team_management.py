@@ -1,239 +1,441 @@
 """
 Team management UI for Wiffle Ball Manager
 """
-from rich.console import Console
-from rich.table import Table
+from rich.console import Console, Group
+from rich.table import Table, Column
 from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
+from rich.style import Style
+from rich.prompt import Prompt
 from rich.text import Text
+from operator import attrgetter
 from typing import List, Optional
 from models.team import Team
 from models.player import Player
-from utils.constants import COLORS
+from utils.constants import COLORS, LEADER_MIN_AB, LEADER_MIN_IP
+
+# Resolve UI colors once at import instead of per cell/column
+_C_TITLE = COLORS["TITLE"]
+_C_SUBTITLE = COLORS["SUBTITLE"]
+_C_SUCCESS = COLORS["SUCCESS"]
+_C_WARNING = COLORS["WARNING"]
+_C_ERROR = COLORS["ERROR"]
+_C_INFO = COLORS["INFO"]
+_C_HIGHLIGHT = COLORS["HIGHLIGHT"]
+_C_DIM = COLORS["DIM"]
+
+# Parsed once so Rich doesn't re-parse style strings for every table, panel and header
+# (the _C_ strings stay for console markup)
+_S_TITLE = Style.parse(_C_TITLE)
+_S_SUCCESS = Style.parse(_C_SUCCESS)
+_S_WARNING = Style.parse(_C_WARNING)
+_S_INFO = Style.parse(_C_INFO)
+_S_DIM = Style.parse(_C_DIM)
+_S_TOTAL_ROW = Style.parse("bold white")
+
+# Roster status and team labels repeated across roster and leader rows
+_ACTIVE = "Active"
+_RESERVE = "Reserve"
+_FREE_AGENT = "FA"
+
+# Shown by the selection prompts for input that isn't a number
+_INVALID_SELECTION = f"[{_C_ERROR}]Please enter a valid number or 'b' to go back[/]"
+
+# Table column schemas: (header, Column options). Columns are rebuilt from these per
+# table because Rich stores each table's cells on its Column objects.
+def _column_schema(*columns: tuple) -> tuple:
+    """Column schema with its style strings parsed into Style objects up front"""
+    return tuple(
+        (header, {**options, "style": Style.parse(options["style"])} if "style" in options else options)
+        for header, options in columns
+    )
+
+
+def _rating_column(header: str, style: str, width: int) -> tuple:
+    """Schema entry for a right-aligned numeric rating column"""
+    return (header, {"style": style, "width": width, "min_width": 3, "justify": "right", "no_wrap": True})
+
+
+_ROSTER_STAT_COLUMNS = (
+    ("AVG", {"style": _C_INFO, "width": 6, "min_width": 5, "justify": "right", "no_wrap": True}),
+    ("ERA", {"style": _C_INFO, "width": 6, "min_width": 5, "justify": "right", "no_wrap": True}),
+)
+
+_ROSTER_COLUMNS_COMPACT = _column_schema(
+    ("#", {"style": _C_SUBTITLE, "width": 3, "min_width": 2, "justify": "right", "no_wrap": True}),
+    ("Name", {"style": _C_HIGHLIGHT, "width": 16, "min_width": 12, "overflow": "fold"}),
+    # Compact: fewer columns so data doesn't truncate
+    _rating_column("PWR", _C_INFO, 4),
+    _rating_column("CON", _C_INFO, 4),
+    _rating_column("VEL", _C_INFO, 4),
+    _rating_column("CTL", _C_INFO, 4),
+    *_ROSTER_STAT_COLUMNS,
+    ("Status", {"style": _C_SUBTITLE, "width": 9, "min_width": 7, "overflow": "fold"}),
+)
+
+_ROSTER_COLUMNS_FULL = _column_schema(
+    ("#", {"style": _C_SUBTITLE, "width": 3, "min_width": 2, "justify": "right", "no_wrap": True}),
+    ("Name", {"style": _C_HIGHLIGHT, "width": 20, "min_width": 12, "overflow": "fold"}),
+    _rating_column("PWR", _C_INFO, 5),
+    _rating_column("CON", _C_INFO, 5),
+    _rating_column("SPD", _C_INFO, 5),
+    _rating_column("VEL", _C_INFO, 5),
+    _rating_column("CTL", _C_INFO, 5),
+    _rating_column("STA", _C_INFO, 5),
+    _rating_column("RNG", _C_SUCCESS, 5),
+    _rating_column("ARM", _C_SUCCESS, 5),
+    *_ROSTER_STAT_COLUMNS,
+    ("Status", {"style": _C_SUBTITLE, "width": 10, "min_width": 7, "overflow": "fold"}),
+)
+
+# Rating attributes shown in each roster layout, in column order
+_ROSTER_RATINGS_COMPACT = attrgetter("power", "contact", "velocity", "control")
+_ROSTER_RATINGS_FULL = attrgetter(
+    "power", "contact", "speed", "velocity", "control", "stamina", "range", "arm_strength"
+)
+
+_STANDINGS_COLUMNS = _column_schema(
+    ("Rank", {"style": _C_HIGHLIGHT}),
+    ("Team", {"style": _C_TITLE}),
+    ("W", {"style": _C_SUCCESS}),
+    ("L", {"style": _C_ERROR}),
+    ("T", {"style": _C_WARNING}),
+    ("PCT", {"style": _C_INFO}),
+    ("RS", {"style": _C_INFO}),
+    ("RA", {"style": _C_INFO}),
+)
+
+_TEAM_SELECT_COLUMNS = _column_schema(
+    ("Number", {"style": _C_HIGHLIGHT}),
+    ("Team", {"style": _C_TITLE}),
+    ("Division", {"style": _C_SUBTITLE}),
+    ("Record", {"style": _C_INFO}),
+)
+
+_CAREER_BATTING_COLUMNS = _column_schema(
+    ("Season", {"style": "cyan", "width": 8}),
+    ("GP", {"style": "white", "width": 4}),
+    ("AB", {"style": "white", "width": 4}),
+    ("H", {"style": "green", "width": 4}),
+    ("HR", {"style": "yellow", "width": 4}),
+    ("RBI", {"style": "white", "width": 4}),
+    ("BB", {"style": "blue", "width": 4}),
+    ("K", {"style": "red", "width": 4}),
+    ("AVG", {"style": "green", "width": 6}),
+    ("OBP", {"style": "cyan", "width": 6}),
+    ("SLG", {"style": "yellow", "width": 6}),
+)
+
+_CAREER_PITCHING_COLUMNS = _column_schema(
+    ("Season", {"style": "cyan", "width": 8}),
+    ("GP", {"style": "white", "width": 4}),
+    ("GS", {"style": "white", "width": 4}),
+    ("IP", {"style": "blue", "width": 6}),
+    ("W", {"style": "green", "width": 3}),
+    ("L", {"style": "red", "width": 3}),
+    ("K", {"style": "yellow", "width": 4}),
+    ("BB", {"style": "red", "width": 4}),
+    ("ERA", {"style": "cyan", "width": 6}),
+    ("WHIP", {"style": "magenta", "width": 6}),
+)
+
+_CAREER_BATTING_HEADER = Style.parse("bold cyan")
+_CAREER_PITCHING_HEADER = Style.parse("bold magenta")
+
+
+def _compile_cells(*cells: tuple) -> tuple:
+    """
+    Prepare (stat attribute, format) cell specs for row building
+    
+    Returns (attrs, fetch, formatters): a single attrgetter fetches every cell's value
+    in one call, and each format is bound once (plain str for "{}").
+    """
+    attrs = tuple(attr for attr, _ in cells)
+    formatters = tuple(str if fmt == "{}" else fmt.format for _, fmt in cells)
+    return attrs, attrgetter(*attrs), formatters
+
+
+# Career grid cells after the Season column, in column order
+_CAREER_BATTING_CELLS = _compile_cells(
+    ("gp", "{}"), ("ab", "{}"), ("h", "{}"), ("hr", "{}"), ("rbi", "{}"), ("bb", "{}"), ("k", "{}"),
+    ("avg", "{:.3f}"), ("calc_obp", "{:.3f}"), ("calc_slg", "{:.3f}"),
+)
+_CAREER_PITCHING_CELLS = _compile_cells(
+    ("gp", "{}"), ("gs", "{}"), ("ip", "{:.1f}"), ("w", "{}"), ("l", "{}"), ("k", "{}"), ("bb", "{}"),
+    ("era", "{:.2f}"), ("whip", "{:.2f}"),
+)
+
+_AVG_LEADER_COLUMNS = (("Rank", {}), ("Player", {}), ("Team", {}), ("AVG", {}), ("AB", {}))
+_ERA_LEADER_COLUMNS = (("Rank", {}), ("Player", {}), ("Team", {}), ("ERA", {}), ("IP", {}))
+_FPCT_LEADER_COLUMNS = (("Rank", {}), ("Player", {}), ("Team", {}), ("FPCT", {}), ("PO", {}), ("A", {}), ("E", {}))
+
+
+def _make_table(columns: tuple, **table_options) -> Table:
+    """Build a Table with fresh Column objects from a column schema"""
+    return Table(*(Column(header, **options) for header, options in columns), **table_options)
+
+
+# Panel and grid text without markup is passed as Text, so Rich skips its markup and
+# emoji processing of the string on every render
+_ROSTER_LEGEND = Text(
+    "PWR=Power, CON=Contact, SPD=Speed, VEL=Velocity, CTL=Control, STA=Stamina, RNG=Range, ARM=Arm Strength"
+)
+
+
+def _stat_grid(*rows: tuple) -> Table:
+    """Label/value grid used as a Panel body, with numbers right-aligned"""
+    grid = Table.grid(padding=(0, 1))
+    grid.add_column()
+    grid.add_column(justify="right")
+    for label, value in rows:
+        grid.add_row(Text(label), Text(str(value)))
+    return grid
+
+
+def _career_row(label: str, stats, cells: tuple) -> list:
+    """One season's row of a career grid"""
+    _, fetch, formatters = cells
+    return [label, *[fmt(value) for fmt, value in zip(formatters, fetch(stats))]]
+
+
+def _career_total_row(totals, cells: tuple) -> list:
+    """Bold TOTAL row of a career grid, with rate stats computed from the combined totals"""
+    _, fetch, formatters = cells
+    return ["[bold]TOTAL[/bold]", *[f"[bold]{fmt(value)}[/bold]" for fmt, value in zip(formatters, fetch(totals))]]
+
+
+def _stat_index(players):
+    """StatIndex over players (passed through if already one); numpy loads on first use"""
+    from ui._stat_kernels import StatIndex
+    return players if isinstance(players, StatIndex) else StatIndex(players)
+
 
 class TeamManagementUI:
     """UI for managing teams and viewing stats"""
     
-    def __init__(self):
-        self.console = Console()
+    def __init__(self, console: Optional[Console] = None):
+        # Accept an injected console (e.g. Console(record=True)) so callers can capture output
+        self._console = console
+        # Last built tables/panels per screen part: part name -> (key, renderables)
+        self._screen_parts = {}
+    
+    @property
+    def console(self) -> Console:
+        """Output console, created on first use"""
+        if self._console is None:
+            # Styling here is explicit (markup, Style objects), so skip Rich's regex
+            # highlighter pass over every printed string
+            self._console = Console(highlight=False)
+        return self._console
+    
+    @console.setter
+    def console(self, console: Console):
+        self._console = console
+    
+    def _render_screen(self, *renderables):
+        """Clear the terminal and draw a new screen in one buffered write"""
+        # Buffering the clear together with the frame avoids the blank flash between them;
+        # redirected output (tests, captured consoles) has no screen to clear
+        with self.console:
+            if self.console.is_terminal:
+                self.console.clear()
+            self.console.print(Group(*renderables))
+    
+    def _cached_part(self, part: str, key: tuple, build) -> list:
+        """Renderables for a screen part, rebuilt only when its key changes
+        
+        Rich tables and panels can be rendered again as they are, so a screen that
+        comes back unchanged (e.g. the roster after player details) reuses them.
+        """
+        cached = self._screen_parts.get(part)
+        if cached is None or cached[0] != key:
+            cached = (key, build())
+            self._screen_parts[part] = cached
+        return cached[1]
     
     def show_team_overview(self, team: Team):
         """Display team overview with record and key stats"""
-        self.console.clear()
-        
+        # Render the whole screen in a single print
+        self._render_screen(*self._overview_part(team, self._overview_key(team)))
+    
+    def show_roster(self, team: Team, show_reserves: bool = False):
+        """Display team roster with player stats"""
+        roster, compact_layout = self._roster_layout(team, show_reserves)
+        key = self._roster_key(team, roster, compact_layout)
+        self._render_screen(*self._roster_part(team, roster, compact_layout, key))
+    
+    def show_team_screen(self, team: Team, show_reserves: bool = True):
+        """Display the team overview and roster together as one screen"""
+        roster, compact_layout = self._roster_layout(team, show_reserves)
+        overview_key = self._overview_key(team)
+        roster_key = self._roster_key(team, roster, compact_layout)
+        
+        self._render_screen(
+            *self._overview_part(team, overview_key),
+            "",
+            *self._roster_part(team, roster, compact_layout, roster_key)
+        )
+    
+    def _overview_part(self, team: Team, key: tuple) -> list:
+        """Overview panels for ``key``, reused while the overview is unchanged"""
+        return self._cached_part("overview", key, lambda: self._team_overview_renderables(team))
+    
+    def _roster_part(self, team: Team, roster: list, compact_layout: bool, key: tuple) -> list:
+        """Roster table and legend for ``key``, reused while the roster is unchanged"""
+        return self._cached_part("roster", key, lambda: self._roster_renderables(team, roster, compact_layout, key))
+    
+    def _overview_key(self, team: Team) -> tuple:
+        """Everything the team overview shows"""
+        return (
+            "overview", self.console.width, team.name, team.division, team.wins, team.losses, team.ties,
+            team.runs_scored, team.runs_allowed, len(team.active_roster), len(team.reserve_roster)
+        )
+    
+    def _team_overview_renderables(self, team: Team) -> list:
+        """Build the team header, season stats and roster summary panels"""
         # Team header
         header = Text()
-        header.append(f"{team.name}", style=COLORS["TITLE"])
-        header.append(f" ({team.division})", style=COLORS["DIM"])
-        
-        panel = Panel(header, border_style=COLORS["TITLE"])
-        self.console.print(panel)
+        header.append(team.name, style=_S_TITLE)
+        header.append(f" ({team.division})", style=_S_DIM)
         
-        # Team record and run differential
-        record_text = f"Record: {team.wins}-{team.losses}-{team.ties}"
-        runs_text = f"Runs For: {team.runs_scored} | Runs Against: {team.runs_allowed}"
-        
-        # Calculate run differential
-        run_diff = team.runs_scored - team.runs_allowed
-        diff_text = f"Run Differential: {run_diff:+d}"  # + shows positive sign
+        panel = Panel(header, border_style=_S_TITLE)
         
+        # Team record and run differential (+ shows positive sign)
         stats_panel = Panel(
-            f"{record_text}\n{runs_text}\n{diff_text}",
+            Text(
+                f"Record: {team.wins}-{team.losses}-{team.ties}\n"
+                f"Runs For: {team.runs_scored} | Runs Against: {team.runs_allowed}\n"
+                f"Run Differential: {team.run_differential:+d}"
+            ),
             title="Season Stats",
-            border_style=COLORS["INFO"]
+            border_style=_S_INFO
         )
-        self.console.print(stats_panel)
         
         # Roster summary
-        active_count = len(team.active_roster)
-        reserve_count = len(team.reserve_roster)
-        
         roster_panel = Panel(
-            f"Active Players: {active_count}/6\nReserve Players: {reserve_count}/2",
+            Text(f"Active Players: {len(team.active_roster)}/6\nReserve Players: {len(team.reserve_roster)}/2"),
             title="Roster",
-            border_style=COLORS["INFO"]
+            border_style=_S_INFO
         )
-        self.console.print(roster_panel)
-    
-    def show_roster(self, team: Team, show_reserves: bool = False):
-        """Display team roster with player stats"""
-        self.console.clear()
         
+        return [panel, stats_panel, roster_panel]
+    
+    def _roster_layout(self, team: Team, show_reserves: bool) -> tuple:
+        """(player, status) rows to list and whether to use the compact layout"""
         # Decide between full or compact layout based on terminal width
         available_width = getattr(self.console, "width", 120) or 120
         compact_layout = available_width < 120
-
-        # Create roster table with key attributes only
-        table = Table(title=f"{team.name} Roster", expand=True)
-        table.add_column("#", style=COLORS["SUBTITLE"], width=3, min_width=2, justify="right", no_wrap=True)
-        table.add_column("Name", style=COLORS["HIGHLIGHT"], width=16 if compact_layout else 20, min_width=12, overflow="fold")
-
-        if compact_layout:
-            # Compact: fewer columns so data doesn't truncate
-            table.add_column("PWR", style=COLORS["INFO"], width=4, min_width=3, justify="right", no_wrap=True)
-            table.add_column("CON", style=COLORS["INFO"], width=4, min_width=3, justify="right", no_wrap=True)
-            table.add_column("VEL", style=COLORS["INFO"], width=4, min_width=3, justify="right", no_wrap=True)
-            table.add_column("CTL", style=COLORS["INFO"], width=4, min_width=3, justify="right", no_wrap=True)
-        else:
-            # Full layout
-            table.add_column("PWR", style=COLORS["INFO"], width=5, min_width=3, justify="right", no_wrap=True)
-            table.add_column("CON", style=COLORS["INFO"], width=5, min_width=3, justify="right", no_wrap=True)
-            table.add_column("SPD", style=COLORS["INFO"], width=5, min_width=3, justify="right", no_wrap=True)
-            table.add_column("VEL", style=COLORS["INFO"], width=5, min_width=3, justify="right", no_wrap=True)
-            table.add_column("CTL", style=COLORS["INFO"], width=5, min_width=3, justify="right", no_wrap=True)
-            table.add_column("STA", style=COLORS["INFO"], width=5, min_width=3, justify="right", no_wrap=True)
-            table.add_column("RNG", style=COLORS["SUCCESS"], width=5, min_width=3, justify="right", no_wrap=True)
-            table.add_column("ARM", style=COLORS["SUCCESS"], width=5, min_width=3, justify="right", no_wrap=True)
-
-        # Stats (always shown)
-        table.add_column("AVG", style=COLORS["INFO"], width=6, min_width=5, justify="right", no_wrap=True)
-        table.add_column("ERA", style=COLORS["INFO"], width=6, min_width=5, justify="right", no_wrap=True)
-        table.add_column("Status", style=COLORS["SUBTITLE"], width=9 if compact_layout else 10, min_width=7, overflow="fold")
-        
-        # Add active players
-        player_num = 1
-        for player in team.active_roster:
-            avg = f"{player.batting_stats.avg:.3f}" if player.batting_stats.ab > 0 else "N/A"
-            era = f"{player.pitching_stats.era:.2f}" if player.pitching_stats.ip > 0 else "N/A"
-            
-            if compact_layout:
-                table.add_row(
-                    str(player_num),
-                    player.name,
-                    str(player.power),
-                    str(player.contact),
-                    str(player.velocity),
-                    str(player.control),
-                    avg,
-                    era,
-                    "Active"
-                )
-            else:
-                table.add_row(
-                    str(player_num),
-                    player.name,
-                    str(player.power),
-                    str(player.contact),
-                    str(player.speed),
-                    str(player.velocity),
-                    str(player.control),
-                    str(player.stamina),
-                    str(player.range),
-                    str(player.arm_strength),
-                    avg,
-                    era,
-                    "Active"
-                )
-            player_num += 1
-        
-        # Add reserve players if requested
+        
+        # Collect rows for active (and optionally reserve) players in one pass, then fill the table once
+        rosters = [(team.active_roster, _ACTIVE)]
         if show_reserves:
-            for player in team.reserve_roster:
-                avg = f"{player.batting_stats.avg:.3f}" if player.batting_stats.ab > 0 else "N/A"
-                era = f"{player.pitching_stats.era:.2f}" if player.pitching_stats.ip > 0 else "N/A"
-                
-                if compact_layout:
-                    table.add_row(
-                        str(player_num),
-                        player.name,
-                        str(player.power),
-                        str(player.contact),
-                        str(player.velocity),
-                        str(player.control),
-                        avg,
-                        era,
-                        "Reserve"
-                    )
-                else:
-                    table.add_row(
-                        str(player_num),
-                        player.name,
-                        str(player.power),
-                        str(player.contact),
-                        str(player.speed),
-                        str(player.velocity),
-                        str(player.control),
-                        str(player.stamina),
-                        str(player.range),
-                        str(player.arm_strength),
-                        avg,
-                        era,
-                        "Reserve"
-                    )
-                player_num += 1
-        
-        self.console.print(table)
+            rosters.append((team.reserve_roster, _RESERVE))
+        roster = [(player, status) for players, status in rosters for player in players]
+        return roster, compact_layout
+    
+    def _roster_key(self, team: Team, roster: list, compact_layout: bool) -> tuple:
+        """
+        Everything the roster table shows: layout, names, statuses, ratings and the AVG/ERA inputs
+        
+        Ends with one (name, status, ratings, h, ab, er, ip) entry per row, which the
+        table is built from.
+        """
+        ratings = _ROSTER_RATINGS_COMPACT if compact_layout else _ROSTER_RATINGS_FULL
+        return ("roster", self.console.width, team.name, tuple(
+            (player.name, status, ratings(player), player.batting_stats.h, player.batting_stats.ab,
+             player.pitching_stats.er, player.pitching_stats.ip)
+            for player, status in roster
+        ))
+    
+    def _roster_renderables(self, team: Team, roster: list, compact_layout: bool, key: tuple) -> list:
+        """Build the roster table and its legend from the roster and its ``_roster_key`` snapshot"""
+        # Create roster table with key attributes only
+        columns = _ROSTER_COLUMNS_COMPACT if compact_layout else _ROSTER_COLUMNS_FULL
+        table = _make_table(columns, title=f"{team.name} Roster", expand=True)
+        
+        # Format the AVG/ERA columns for the whole roster in one vectorized pass
+        stats = _stat_index(player for player, _ in roster)
+        avg_column = stats.avg_text()
+        era_column = stats.era_text()
+        
+        # Names, statuses and ratings were already read into the key's per-player
+        # snapshot, so the rows are built from it rather than from the players again
+        rows = [
+            (str(player_num), name, *map(str, ratings), avg, era, status)
+            for player_num, ((name, status, ratings, *_), avg, era) in enumerate(zip(key[-1], avg_column, era_column), 1)
+        ]
+        
+        for row in rows:
+            table.add_row(*row)
         
         # Show legend
         legend = Panel(
-            "PWR=Power, CON=Contact, SPD=Speed, VEL=Velocity, CTL=Control, STA=Stamina, RNG=Range, ARM=Arm Strength",
+            _ROSTER_LEGEND,
             title="Legend",
-            border_style=COLORS["INFO"]
+            border_style=_S_INFO
         )
-        self.console.print(legend)
+        return [table, legend]
     
     def show_player_details(self, player: Player, current_season: Optional[int] = None):
         """Display detailed player information with career stats grid"""
-        self.console.clear()
-        
         # Player header
         header = Text()
-        header.append(f"{player.name}", style=COLORS["TITLE"])
+        header.append(player.name, style=_S_TITLE)
         if player.team:
-            header.append(f" - {player.team}", style=COLORS["DIM"])
+            header.append(f" - {player.team}", style=_S_DIM)
         
-        panel = Panel(header, border_style=COLORS["TITLE"])
-        self.console.print(panel)
+        panel = Panel(header, border_style=_S_TITLE)
         
         # Basic info
         seasons_played = len(player.seasons_played) if player.seasons_played else 0
         info_panel = Panel(
-            f"Age: {player.age}\n"
-            f"Seasons Played: {seasons_played}\n"
-            f"Retired: {'Yes' if player.retired else 'No'}\n"
-            f"Velocity: {player.velocity}\n"
-            f"Control: {player.control}\n"
-            f"Stamina: {player.stamina}\n"
-            f"Speed Control: {player.speed_control}",
+            _stat_grid(
+                ("Age:", player.age),
+                ("Seasons Played:", seasons_played),
+                ("Retired:", "Yes" if player.retired else "No"),
+                ("Velocity:", player.velocity),
+                ("Control:", player.control),
+                ("Stamina:", player.stamina),
+                ("Speed Control:", player.speed_control)
+            ),
             title="Player Info",
-            border_style=COLORS["INFO"]
+            border_style=_S_INFO
         )
-        self.console.print(info_panel)
         
         # Fielding attributes
         fielding_attr_panel = Panel(
-            f"Range: {player.range}\n"
-            f"Arm Strength: {player.arm_strength}\n"
-            f"Accuracy: {player.accuracy}",
+            _stat_grid(
+                ("Range:", player.range),
+                ("Arm Strength:", player.arm_strength),
+                ("Accuracy:", player.accuracy)
+            ),
             title="Fielding Attributes",
-            border_style=COLORS["SUCCESS"]
+            border_style=_S_SUCCESS
         )
-        self.console.print(fielding_attr_panel)
         
-        # Show career stats grid (including current season for rookies)
-        self.show_career_stats_grid(player, current_season)
-        
-        # Show current season stats if any
-        self.show_current_season_stats(player)
+        # Career stats grid (including current season for rookies) and current season stats,
+        # rendered together with the header panels in a single print
+        self._render_screen(
+            panel,
+            info_panel,
+            fielding_attr_panel,
+            *self._career_stats_renderables(player, current_season),
+            *self._current_season_renderables(player)
+        )
     
     def show_career_stats_grid(self, player: Player, current_season: Optional[int] = None):
         """Display career stats in a season-by-season grid"""
+        renderables = self._career_stats_renderables(player, current_season)
+        if renderables:
+            self.console.print(Group(*renderables))
+    
+    def _career_stats_renderables(self, player: Player, current_season: Optional[int] = None) -> list:
+        """Build the career stats grid renderables for a player"""
         seasons = player.seasons_played.copy() if player.seasons_played else []
         
-        # Get current season number - use provided value or try to get from game engine
+        # Current season number comes from the caller (the season simulator); without it,
+        # estimate it as the season after the player's last completed one
         if current_season is None:
-            try:
-                from game.engine import GameEngine
-                engine = GameEngine()
-                season_sim = engine.get_game_data("season_simulator")
-                if season_sim:
-                    current_season_num = season_sim.current_season
-                else:
-                    # Fallback: estimate from player's seasons
-                    current_season_num = max(seasons) + 1 if seasons else 1
-            except:
-                # Fallback: estimate from player's seasons
-                current_season_num = max(seasons) + 1 if seasons else 1
+            current_season_num = max(seasons) + 1 if seasons else 1
         else:
             current_season_num = current_season
         has_current_batting = player.batting_stats.ab > 0
@@ -245,397 +447,294 @@ class TeamManagementUI:
                 seasons.append(current_season_num)
         
         if not seasons:
-            return
-        
-        self.console.print(f"\n[{COLORS['TITLE']}]CAREER STATISTICS[/]")
+            return []
+        
+        renderables = [f"\n[{_C_TITLE}]CAREER STATISTICS[/]"]
+        
+        # One pass over the seasons picks each season's batting/pitching line (None when
+        # it has nothing to show) and whether either grid has any rows at all.
+        # Archived stats for completed seasons, current stats for the current season,
+        # which is always shown (including zeros for rookies).
+        season_batting = player.career_stats.season_batting
+        season_pitching = player.career_stats.season_pitching
+        season_lines = []
+        has_batting_stats = has_pitching_stats = False
+        for season in seasons:
+            if season == current_season_num:
+                batting_stats, pitching_stats = player.batting_stats, player.pitching_stats
+            else:
+                batting_stats = season_batting.get(season)
+                if batting_stats is not None and batting_stats.ab <= 0:
+                    batting_stats = None
+                pitching_stats = season_pitching.get(season)
+                if pitching_stats is not None and pitching_stats.ip <= 0:
+                    pitching_stats = None
+            season_lines.append((season, batting_stats, pitching_stats))
+            has_batting_stats = has_batting_stats or batting_stats is not None
+            has_pitching_stats = has_pitching_stats or pitching_stats is not None
         
         # Batting Stats Grid
-        has_batting_stats = any(
-            (player.career_stats.season_batting.get(season, None) and 
-             player.career_stats.season_batting[season].ab > 0) or
-            (season == current_season_num)  # Always show current season for rookies
-            for season in seasons
-        )
-        
         if has_batting_stats:
-            batting_table = Table(title="Career Batting Stats", show_header=True, header_style="bold cyan")
-            batting_table.add_column("Season", style="cyan", width=8)
-            batting_table.add_column("GP", style="white", width=4)
-            batting_table.add_column("AB", style="white", width=4)
-            batting_table.add_column("H", style="green", width=4)
-            batting_table.add_column("HR", style="yellow", width=4)
-            batting_table.add_column("RBI", style="white", width=4)
-            batting_table.add_column("BB", style="blue", width=4)
-            batting_table.add_column("K", style="red", width=4)
-            batting_table.add_column("AVG", style="green", width=6)
-            batting_table.add_column("OBP", style="cyan", width=6)
-            batting_table.add_column("SLG", style="yellow", width=6)
+            batting_table = _make_table(
+                _CAREER_BATTING_COLUMNS, title="Career Batting Stats", show_header=True, header_style=_CAREER_BATTING_HEADER
+            )
             
-            for season in seasons:
-                # Use archived stats for completed seasons, current stats for current season
-                if season == current_season_num:
-                    batting_stats = player.batting_stats
-                    season_label = f"Season {season}"
-                else:
-                    batting_stats = player.career_stats.season_batting.get(season)
-                    season_label = f"Season {season}"
-                
-                # Show stats if they exist (including zeros for current season)
-                if batting_stats and (batting_stats.ab > 0 or season == current_season_num):
-                    batting_table.add_row(
-                        season_label,
-                        str(batting_stats.gp),
-                        str(batting_stats.ab),
-                        str(batting_stats.h),
-                        str(batting_stats.hr),
-                        str(batting_stats.rbi),
-                        str(batting_stats.bb),
-                        str(batting_stats.k),
-                        f"{batting_stats.avg:.3f}",
-                        f"{batting_stats.calc_obp:.3f}",
-                        f"{batting_stats.calc_slg:.3f}"
-                    )
+            for season, batting_stats, _ in season_lines:
+                if batting_stats is not None:
+                    batting_table.add_row(*_career_row(f"Season {season}", batting_stats, _CAREER_BATTING_CELLS))
             
             # Add combined totals row (career + current season)
-            career_batting = player.career_stats.career_batting
-            current_batting = player.batting_stats if has_current_batting else None
+            totals = player.career_stats.batting_totals(player.batting_stats if has_current_batting else None)
             
-            # Calculate combined totals
-            total_gp = career_batting.gp + (current_batting.gp if current_batting else 0)
-            total_ab = career_batting.ab + (current_batting.ab if current_batting else 0)
-            total_h = career_batting.h + (current_batting.h if current_batting else 0)
-            total_hr = career_batting.hr + (current_batting.hr if current_batting else 0)
-            total_rbi = career_batting.rbi + (current_batting.rbi if current_batting else 0)
-            total_bb = career_batting.bb + (current_batting.bb if current_batting else 0)
-            total_k = career_batting.k + (current_batting.k if current_batting else 0)
+            if totals.ab > 0:
+                batting_table.add_row(*_career_total_row(totals, _CAREER_BATTING_CELLS), style=_S_TOTAL_ROW)
             
-            # Calculate combined averages
-            total_avg = total_h / total_ab if total_ab > 0 else 0.0
-            total_obp_num = total_h + total_bb + (current_batting.hbp if current_batting else 0) + career_batting.hbp
-            total_obp_denom = total_ab + total_bb + (current_batting.hbp if current_batting else 0) + career_batting.hbp
-            total_obp = total_obp_num / total_obp_denom if total_obp_denom > 0 else 0.0
-            
-            # Simplified SLG calculation (assumes singles = h - 2b - 3b - hr, but we don't track 2b/3b separately)
-            total_slg = total_avg + (total_hr * 3 / total_ab) if total_ab > 0 else 0.0  # Rough approximation
-            
-            if total_ab > 0:
-                batting_table.add_row(
-                    "[bold]TOTAL[/bold]",
-                    f"[bold]{total_gp}[/bold]",
-                    f"[bold]{total_ab}[/bold]",
-                    f"[bold]{total_h}[/bold]",
-                    f"[bold]{total_hr}[/bold]",
-                    f"[bold]{total_rbi}[/bold]",
-                    f"[bold]{total_bb}[/bold]",
-                    f"[bold]{total_k}[/bold]",
-                    f"[bold]{total_avg:.3f}[/bold]",
-                    f"[bold]{total_obp:.3f}[/bold]",
-                    f"[bold]{total_slg:.3f}[/bold]",
-                    style="bold white"
-                )
-            
-            self.console.print(batting_table)
+            renderables.append(batting_table)
         
         # Pitching Stats Grid
-        has_pitching_stats = any(
-            (player.career_stats.season_pitching.get(season, None) and 
-             player.career_stats.season_pitching[season].ip > 0) or
-            (season == current_season_num)  # Always show current season for rookies
-            for season in seasons
-        )
-        
         if has_pitching_stats:
-            pitching_table = Table(title="Career Pitching Stats", show_header=True, header_style="bold magenta")
-            pitching_table.add_column("Season", style="cyan", width=8)
-            pitching_table.add_column("GP", style="white", width=4)
-            pitching_table.add_column("GS", style="white", width=4)
-            pitching_table.add_column("IP", style="blue", width=6)
-            pitching_table.add_column("W", style="green", width=3)
-            pitching_table.add_column("L", style="red", width=3)
-            pitching_table.add_column("K", style="yellow", width=4)
-            pitching_table.add_column("BB", style="red", width=4)
-            pitching_table.add_column("ERA", style="cyan", width=6)
-            pitching_table.add_column("WHIP", style="magenta", width=6)
+            pitching_table = _make_table(
+                _CAREER_PITCHING_COLUMNS, title="Career Pitching Stats", show_header=True, header_style=_CAREER_PITCHING_HEADER
+            )
             
-            for season in seasons:
-                # Use archived stats for completed seasons, current stats for current season
-                if season == current_season_num:
-                    pitching_stats = player.pitching_stats
-                    season_label = f"Season {season}"
-                else:
-                    pitching_stats = player.career_stats.season_pitching.get(season)
-                    season_label = f"Season {season}"
-                
-                # Show stats if they exist (including zeros for current season)
-                if pitching_stats and (pitching_stats.ip > 0 or season == current_season_num):
-                    pitching_table.add_row(
-                        season_label,
-                        str(pitching_stats.gp),
-                        str(pitching_stats.gs),
-                        f"{pitching_stats.ip:.1f}",
-                        str(pitching_stats.w),
-                        str(pitching_stats.l),
-                        str(pitching_stats.k),
-                        str(pitching_stats.bb),
-                        f"{pitching_stats.era:.2f}",
-                        f"{pitching_stats.whip:.2f}"
-                    )
+            for season, _, pitching_stats in season_lines:
+                if pitching_stats is not None:
+                    pitching_table.add_row(*_career_row(f"Season {season}", pitching_stats, _CAREER_PITCHING_CELLS))
             
             # Add combined totals row (career + current season)
-            career_pitching = player.career_stats.career_pitching
-            current_pitching = player.pitching_stats if has_current_pitching else None
-            
-            # Calculate combined totals
-            total_gp = career_pitching.gp + (current_pitching.gp if current_pitching else 0)
-            total_gs = career_pitching.gs + (current_pitching.gs if current_pitching else 0)
-            total_ip = career_pitching.ip + (current_pitching.ip if current_pitching else 0.0)
-            total_w = career_pitching.w + (current_pitching.w if current_pitching else 0)
-            total_l = career_pitching.l + (current_pitching.l if current_pitching else 0)
-            total_k = career_pitching.k + (current_pitching.k if current_pitching else 0)
-            total_bb = career_pitching.bb + (current_pitching.bb if current_pitching else 0)
-            total_er = career_pitching.er + (current_pitching.er if current_pitching else 0)
-            total_h = career_pitching.h + (current_pitching.h if current_pitching else 0)
-            
-            # Calculate combined ERA and WHIP
-            total_era = (total_er * 3) / total_ip if total_ip > 0 else 0.0  # MLW games are 3 innings
-            total_whip = (total_bb + total_h) / total_ip if total_ip > 0 else 0.0
+            totals = player.career_stats.pitching_totals(player.pitching_stats if has_current_pitching else None)
             
-            if total_ip > 0:
-                pitching_table.add_row(
-                    "[bold]TOTAL[/bold]",
-                    f"[bold]{total_gp}[/bold]",
-                    f"[bold]{total_gs}[/bold]",
-                    f"[bold]{total_ip:.1f}[/bold]",
-                    f"[bold]{total_w}[/bold]",
-                    f"[bold]{total_l}[/bold]",
-                    f"[bold]{total_k}[/bold]",
-                    f"[bold]{total_bb}[/bold]",
-                    f"[bold]{total_era:.2f}[/bold]",
-                    f"[bold]{total_whip:.2f}[/bold]",
-                    style="bold white"
-                )
+            if totals.ip > 0:
+                pitching_table.add_row(*_career_total_row(totals, _CAREER_PITCHING_CELLS), style=_S_TOTAL_ROW)
             
-            self.console.print(pitching_table)
+            renderables.append(pitching_table)
+        
+        return renderables
     
     def show_current_season_stats(self, player: Player):
         """Show current season stats panels"""
-        self.console.print(f"\n[{COLORS['WARNING']}]CURRENT SEASON STATS[/]")
+        self.console.print(Group(*self._current_season_renderables(player)))
+    
+    def _current_season_renderables(self, player: Player) -> list:
+        """Build the current season stats panels for a player"""
+        renderables = [f"\n[{_C_WARNING}]CURRENT SEASON STATS[/]"]
         
         # Current season batting stats
         if player.batting_stats.ab > 0:
+            batting = player.batting_stats
+            # Read the rate stats once; OPS is their rounded sum (same as calc_ops)
+            obp, slg = batting.calc_obp, batting.calc_slg
             batting_panel = Panel(
-                f"Games: {player.batting_stats.gp}\n"
-                f"At Bats: {player.batting_stats.ab}\n"
-                f"Hits: {player.batting_stats.h}\n"
-                f"Home Runs: {player.batting_stats.hr}\n"
-                f"RBI: {player.batting_stats.rbi}\n"
-                f"Walks: {player.batting_stats.bb}\n"
-                f"Strikeouts: {player.batting_stats.k}\n"
-                f"Average: {player.batting_stats.avg:.3f}\n"
-                f"OBP: {player.batting_stats.calc_obp:.3f}\n"
-                f"SLG: {player.batting_stats.calc_slg:.3f}\n"
-                f"OPS: {player.batting_stats.calc_ops:.3f}",
+                _stat_grid(
+                    ("Games:", batting.gp),
+                    ("At Bats:", batting.ab),
+                    ("Hits:", batting.h),
+                    ("Home Runs:", batting.hr),
+                    ("RBI:", batting.rbi),
+                    ("Walks:", batting.bb),
+                    ("Strikeouts:", batting.k),
+                    ("Average:", f"{batting.avg:.3f}"),
+                    ("OBP:", f"{obp:.3f}"),
+                    ("SLG:", f"{slg:.3f}"),
+                    ("OPS:", f"{round(obp + slg, 3):.3f}")
+                ),
                 title="Current Season Batting",
-                border_style=COLORS["SUCCESS"]
+                border_style=_S_SUCCESS
             )
-            self.console.print(batting_panel)
+            renderables.append(batting_panel)
         
         # Current season pitching stats
         if player.pitching_stats.ip > 0:
+            pitching = player.pitching_stats
             pitching_panel = Panel(
-                f"Games: {player.pitching_stats.gp}\n"
-                f"Starts: {player.pitching_stats.gs}\n"
-                f"Innings: {player.pitching_stats.ip:.1f}\n"
-                f"Wins: {player.pitching_stats.w}\n"
-                f"Losses: {player.pitching_stats.l}\n"
-                f"Strikeouts: {player.pitching_stats.k}\n"
-                f"Walks: {player.pitching_stats.bb}\n"
-                f"ERA: {player.pitching_stats.era:.2f}\n"
-                f"WHIP: {player.pitching_stats.whip:.2f}\n"
-                f"K/BB: {player.pitching_stats.so_bb:.2f}",
+                _stat_grid(
+                    ("Games:", pitching.gp),
+                    ("Starts:", pitching.gs),
+                    ("Innings:", f"{pitching.ip:.1f}"),
+                    ("Wins:", pitching.w),
+                    ("Losses:", pitching.l),
+                    ("Strikeouts:", pitching.k),
+                    ("Walks:", pitching.bb),
+                    ("ERA:", f"{pitching.era:.2f}"),
+                    ("WHIP:", f"{pitching.whip:.2f}"),
+                    ("K/BB:", f"{pitching.so_bb:.2f}")
+                ),
                 title="Current Season Pitching",
-                border_style=COLORS["WARNING"]
+                border_style=_S_WARNING
             )
-            self.console.print(pitching_panel)
+            renderables.append(pitching_panel)
         
         # Current season fielding stats
-        if (player.fielding_stats.po + player.fielding_stats.a + player.fielding_stats.e) > 0:
+        fielding = player.fielding_stats
+        if fielding.po + fielding.a + fielding.e > 0:
             fielding_panel = Panel(
-                f"Putouts: {player.fielding_stats.po}\n"
-                f"Assists: {player.fielding_stats.a}\n"
-                f"Errors: {player.fielding_stats.e}\n"
-                f"Double Plays: {player.fielding_stats.dp}\n"
-                f"Fielding Pct: {player.fielding_stats.calc_fpct:.3f}",
+                _stat_grid(
+                    ("Putouts:", fielding.po),
+                    ("Assists:", fielding.a),
+                    ("Errors:", fielding.e),
+                    ("Double Plays:", fielding.dp),
+                    ("Fielding Pct:", f"{fielding.calc_fpct:.3f}")
+                ),
                 title="Current Season Fielding",
-                border_style=COLORS["SUCCESS"]
+                border_style=_S_SUCCESS
             )
-            self.console.print(fielding_panel)
+            renderables.append(fielding_panel)
+        
+        return renderables
     
     def show_league_standings(self, teams: List[Team]):
         """Display league standings"""
-        self.console.clear()
-        
-        # Sort teams by wins
-        teams_sorted = sorted(teams, key=lambda t: t.wins, reverse=True)
-        
-        table = Table(title="League Standings")
-        table.add_column("Rank", style=COLORS["HIGHLIGHT"])
-        table.add_column("Team", style=COLORS["TITLE"])
-        table.add_column("W", style=COLORS["SUCCESS"])
-        table.add_column("L", style=COLORS["ERROR"])
-        table.add_column("T", style=COLORS["WARNING"])
-        table.add_column("PCT", style=COLORS["INFO"])
-        table.add_column("RS", style=COLORS["INFO"])
-        table.add_column("RA", style=COLORS["INFO"])
-        
-        for i, team in enumerate(teams_sorted, 1):
-            total_games = team.wins + team.losses + team.ties
-            pct = team.wins / total_games if total_games > 0 else 0.0
-            
+        from ui._stat_kernels import standings_order
+        # Order (PCT, wins, then run differential) and formatted PCT in one pass
+        order, pct_text = standings_order(teams)
+        
+        records = tuple((t.wins, t.losses, t.ties, t.run_differential) for t in teams)
+        key = ("standings", self.console.width, records, tuple((t.name, t.runs_scored, t.runs_allowed) for t in teams))
+        parts = self._cached_part("standings", key, lambda: [self._standings_table(teams, order, pct_text)])
+        self._render_screen(*parts)
+    
+    def _standings_table(self, teams: List[Team], order: list, pct_text: list) -> Table:
+        """Build the standings table in ``order``"""
+        table = _make_table(_STANDINGS_COLUMNS, title="League Standings")
+        
+        for i, idx in enumerate(order, 1):
+            team = teams[idx]
             table.add_row(
                 str(i),
                 team.name,
                 str(team.wins),
                 str(team.losses),
                 str(team.ties),
-                f"{pct:.3f}",
+                pct_text[idx],
                 str(team.runs_scored),
                 str(team.runs_allowed)
             )
         
-        self.console.print(table)
+        return table
     
     def show_stat_leaders(self, teams: List[Team], stat_type: str = "batting"):
         """Display league leaders in various categories"""
-        self.console.clear()
-        
-        all_players = []
-        for team in teams:
-            all_players.extend(team.active_roster)
-            all_players.extend(team.reserve_roster)
+        # Snapshot league stats into arrays once; the leader screens work on the arrays
+        from ui._stat_kernels import StatIndex
+        stats = StatIndex.from_teams(teams)
         
         if stat_type == "batting":
-            self.show_batting_leaders(all_players)
+            renderables = self._batting_leaders_renderables(stats)
         elif stat_type == "pitching":
-            self.show_pitching_leaders(all_players)
+            renderables = self._pitching_leaders_renderables(stats)
         elif stat_type == "fielding":
-            self.show_fielding_leaders(all_players)
+            renderables = self._fielding_leaders_renderables(stats)
+        else:
+            renderables = []
+        
+        self._render_screen(*renderables)
+    
+    def show_batting_leaders(self, players):
+        """Show batting leaders (accepts a list of players or a StatIndex)"""
+        self.console.print(Group(*self._batting_leaders_renderables(players)))
     
-    def show_batting_leaders(self, players: List[Player]):
-        """Show batting leaders"""
+    def _batting_leaders_renderables(self, players) -> list:
+        """Build the batting leader panel and table"""
+        stats = _stat_index(players)
+        
         # Filter players with at-bats
-        batters = [p for p in players if p.batting_stats.ab > 0]
-        
-        if not batters:
-            self.console.print("No batting stats available")
-            return
-        
-        # Sort by different categories
-        avg_leaders = sorted(batters, key=lambda p: p.batting_stats.avg, reverse=True)[:10]
-        hr_leaders = sorted(batters, key=lambda p: p.batting_stats.hr, reverse=True)[:10]
-        rbi_leaders = sorted(batters, key=lambda p: p.batting_stats.rbi, reverse=True)[:10]
-        
-        # Display tables
-        self.console.print(Panel("Batting Average Leaders", style=COLORS["TITLE"]))
-        table = Table()
-        table.add_column("Rank")
-        table.add_column("Player")
-        table.add_column("Team")
-        table.add_column("AVG")
-        table.add_column("AB")
-        
-        for i, player in enumerate(avg_leaders, 1):
-            table.add_row(
-                str(i),
-                player.name,
-                player.team or "FA",
-                f"{player.batting_stats.avg:.3f}",
-                str(player.batting_stats.ab)
-            )
+        batters = stats.ab > 0
+        
+        if not batters.any():
+            return ["No batting stats available"]
+        
+        # Top 10 by AVG, the one category the screen shows; only qualified batters
+        # rank once anyone qualifies
+        qualified = stats.ab >= LEADER_MIN_AB
+        title = f"Batting Average Leaders (min {LEADER_MIN_AB} AB)"
+        if not qualified.any():
+            qualified, title = batters, "Batting Average Leaders"
+        
+        avg_leaders = stats.leader_rows(stats.avg, qualified)
+        
+        # Build tables from the snapshot columns; only the leader rows get formatted
+        table = _make_table(_AVG_LEADER_COLUMNS)
+        avg_column = stats.avg_text(avg_leaders)
+        ab_column = stats.ab[avg_leaders].tolist()
+        
+        for rank, (row, avg, ab) in enumerate(zip(avg_leaders.tolist(), avg_column, ab_column), 1):
+            player = stats.players[row]
+            table.add_row(str(rank), player.name, player.team or _FREE_AGENT, avg, str(ab))
         
-        self.console.print(table)
+        return [Panel(title, style=_S_TITLE), table]
     
-    def show_pitching_leaders(self, players: List[Player]):
-        """Show pitching leaders"""
+    def show_pitching_leaders(self, players):
+        """Show pitching leaders (accepts a list of players or a StatIndex)"""
+        self.console.print(Group(*self._pitching_leaders_renderables(players)))
+    
+    def _pitching_leaders_renderables(self, players) -> list:
+        """Build the pitching leader panel and table"""
+        stats = _stat_index(players)
+        
         # Filter players with innings pitched
-        pitchers = [p for p in players if p.pitching_stats.ip > 0]
-        
-        if not pitchers:
-            self.console.print("No pitching stats available")
-            return
-        
-        # Sort by different categories
-        era_leaders = sorted(pitchers, key=lambda p: p.pitching_stats.era)[:10]
-        k_leaders = sorted(pitchers, key=lambda p: p.pitching_stats.k, reverse=True)[:10]
-        whip_leaders = sorted(pitchers, key=lambda p: p.pitching_stats.whip)[:10]
-        
-        # Display tables
-        self.console.print(Panel("ERA Leaders", style=COLORS["TITLE"]))
-        table = Table()
-        table.add_column("Rank")
-        table.add_column("Player")
-        table.add_column("Team")
-        table.add_column("ERA")
-        table.add_column("IP")
-        
-        for i, player in enumerate(era_leaders, 1):
-            table.add_row(
-                str(i),
-                player.name,
-                player.team or "FA",
-                f"{player.pitching_stats.era:.2f}",
-                f"{player.pitching_stats.ip:.1f}"
-            )
+        pitchers = stats.ip > 0
+        
+        if not pitchers.any():
+            return ["No pitching stats available"]
+        
+        # Top 10 by ERA, the one category the screen shows; only qualified pitchers
+        # rank once anyone qualifies
+        qualified = stats.ip >= LEADER_MIN_IP
+        title = f"ERA Leaders (min {LEADER_MIN_IP} IP)"
+        if not qualified.any():
+            qualified, title = pitchers, "ERA Leaders"
         
-        self.console.print(table)
+        era_leaders = stats.leader_rows(stats.era, qualified, descending=False)
+        
+        # Build tables from the snapshot columns; only the leader rows get formatted
+        table = _make_table(_ERA_LEADER_COLUMNS)
+        era_column = stats.era_text(era_leaders)
+        ip_column = stats.ip[era_leaders].tolist()
+        
+        for rank, (row, era, ip) in enumerate(zip(era_leaders.tolist(), era_column, ip_column), 1):
+            player = stats.players[row]
+            table.add_row(str(rank), player.name, player.team or _FREE_AGENT, era, f"{ip:.1f}")
+        
+        return [Panel(title, style=_S_TITLE), table]
+    
+    def show_fielding_leaders(self, players):
+        """Show fielding leaders (accepts a list of players or a StatIndex)"""
+        self.console.print(Group(*self._fielding_leaders_renderables(players)))
     
-    def show_fielding_leaders(self, players: List[Player]):
-        """Show fielding leaders"""
+    def _fielding_leaders_renderables(self, players) -> list:
+        """Build the fielding leader panel and table"""
+        stats = _stat_index(players)
+        
         # Filter players with fielding chances
-        fielders = [p for p in players if (p.fielding_stats.po + p.fielding_stats.a + p.fielding_stats.e) > 0]
-        
-        if not fielders:
-            self.console.print("No fielding stats available")
-            return
-        
-        # Sort by fielding percentage (minimum 5 chances)
-        fpct_leaders = sorted([p for p in fielders if (p.fielding_stats.po + p.fielding_stats.a + p.fielding_stats.e) >= 5], 
-                             key=lambda p: p.fielding_stats.calc_fpct, reverse=True)[:10]
-        
-        # Display fielding percentage leaders
-        self.console.print(Panel("Fielding Percentage Leaders", style=COLORS["TITLE"]))
-        table = Table()
-        table.add_column("Rank")
-        table.add_column("Player")
-        table.add_column("Team")
-        table.add_column("FPCT")
-        table.add_column("PO")
-        table.add_column("A")
-        table.add_column("E")
-        
-        for i, player in enumerate(fpct_leaders, 1):
+        if not (stats.chances > 0).any():
+            return ["No fielding stats available"]
+        
+        # Top 10 by fielding percentage (minimum 5 chances)
+        fpct_leaders = stats.leader_rows(stats.fpct, stats.chances >= 5)
+        
+        # Build fielding percentage leaders table
+        table = _make_table(_FPCT_LEADER_COLUMNS)
+        fpct_column = stats.fpct_text(fpct_leaders)
+        
+        for rank, (row, fpct) in enumerate(zip(fpct_leaders.tolist(), fpct_column), 1):
+            player = stats.players[row]
+            fielding = player.fielding_stats
             table.add_row(
-                str(i),
+                str(rank),
                 player.name,
-                player.team or "FA",
-                f"{player.fielding_stats.calc_fpct:.3f}",
-                str(player.fielding_stats.po),
-                str(player.fielding_stats.a),
-                str(player.fielding_stats.e)
+                player.team or _FREE_AGENT,
+                fpct,
+                str(fielding.po),
+                str(fielding.a),
+                str(fielding.e)
             )
         
-        self.console.print(table)
+        return [Panel("Fielding Percentage Leaders", style=_S_TITLE), table]
     
     def select_team_to_view(self, teams: List[Team]) -> Optional[Team]:
         """Display team selection interface and return selected team"""
-        self.console.clear()
-        
         # Display teams in a table
-        table = Table(title="Select Team to View")
-        table.add_column("Number", style=COLORS["HIGHLIGHT"])
-        table.add_column("Team", style=COLORS["TITLE"])
-        table.add_column("Division", style=COLORS["SUBTITLE"])
-        table.add_column("Record", style=COLORS["INFO"])
+        table = _make_table(_TEAM_SELECT_COLUMNS, title="Select Team to View")
         
         for i, team in enumerate(teams, 1):
             record = f"{team.wins}-{team.losses}-{team.ties}"
@@ -646,26 +745,27 @@ class TeamManagementUI:
                 record
             )
         
-        self.console.print(table)
+        self._render_screen(table)
         
-        # Get user selection
+        # Get user selection; the prompt and messages don't change between attempts
+        team_count = len(teams)
+        prompt = f"\nSelect team (1-{team_count}) or 'b' to go back"
+        out_of_range = f"[{_C_ERROR}]Please enter a number between 1 and {team_count}[/]"
         while True:
-            try:
-                choice = Prompt.ask(
-                    f"\nSelect team (1-{len(teams)}) or 'b' to go back",
-                    default="b"
-                )
-                
-                if choice.lower() == 'b':
-                    return None
-                
-                team_num = int(choice)
-                if 1 <= team_num <= len(teams):
-                    return teams[team_num - 1]
-                else:
-                    self.console.print(f"[{COLORS['ERROR']}]Please enter a number between 1 and {len(teams)}[/]")
-            except ValueError:
-                self.console.print(f"[{COLORS['ERROR']}]Please enter a valid number or 'b' to go back[/]")
+            choice = Prompt.ask(prompt, default="b")
+            
+            if choice.lower() == 'b':
+                return None
+            
+            # Check the input up front instead of catching int()'s ValueError
+            if not choice.isdecimal():
+                self.console.print(_INVALID_SELECTION)
+                continue
+            
+            team_num = int(choice)
+            if 1 <= team_num <= team_count:
+                return teams[team_num - 1]
+            self.console.print(out_of_range)
     
     def select_player_from_roster(self, team: Team) -> Optional[Player]:
         """Allow user to select a player from the team roster for detailed view"""
@@ -675,20 +775,22 @@ class TeamManagementUI:
             self.console.print("[red]No players found on this team![/red]")
             return None
         
+        # The prompt and messages don't change between attempts
+        player_count = len(all_players)
+        prompt = f"\nSelect player number (1-{player_count}) for details, or 'b' to go back"
+        out_of_range = f"[{_C_ERROR}]Please enter a number between 1 and {player_count}[/]"
         while True:
-            try:
-                choice = Prompt.ask(
-                    f"\nSelect player number (1-{len(all_players)}) for details, or 'b' to go back",
-                    default="b"
-                )
-                
-                if choice.lower() == 'b':
-                    return None
-                
-                player_num = int(choice)
-                if 1 <= player_num <= len(all_players):
-                    return all_players[player_num - 1]
-                else:
-                    self.console.print(f"[{COLORS['ERROR']}]Please enter a number between 1 and {len(all_players)}[/]")
-            except ValueError:
-                self.console.print(f"[{COLORS['ERROR']}]Please enter a valid number or 'b' to go back[/]") 
\ No newline at end of file
+            choice = Prompt.ask(prompt, default="b")
+            
+            if choice.lower() == 'b':
+                return None
+            
+            # Check the input up front instead of catching int()'s ValueError
+            if not choice.isdecimal():
+                self.console.print(_INVALID_SELECTION)
+                continue
+            
+            player_num = int(choice)
+            if 1 <= player_num <= player_count:
+                return all_players[player_num - 1]
+            self.console.print(out_of_range)
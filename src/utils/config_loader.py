@@ -5,70 +5,67 @@ import os
 import yaml
 from typing import Dict, Any
 
+# libyaml's C loader parses the same documents much faster; fall back when it isn't built
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 class SkillModelConfig:
-    """Loads and provides access to skill model configuration"""
+    """
+    Loads and provides access to skill model configuration
+    
+    Each section is resolved into a plain attribute when the file is loaded, so the
+    simulation reads them without a property call and dict lookup per access.
+    """
+    
+    probability_factors: Dict[str, float]      # Probability factors
+    hit_type_weights: Dict[str, float]         # Hit type weights
+    player_development: Dict[str, Any]         # Player development parameters
+    fatigue: Dict[str, float]                  # Fatigue parameters
+    positive_event_chance: float               # Positive development event chance
+    negative_event_chance: float               # Negative development event chance
+    game_balance: Dict[str, Any]               # Game balance parameters
+    development_curves: Dict[str, Any]         # Development curve parameters
+    experience_thresholds: Dict[str, Any]      # Experience threshold parameters
     
     def __init__(self, config_path: str = "data/config/skill_model.yml"):
         self.config_path = config_path
         self._config = None
+        # (mtime, size, inode) of the file the current config was parsed from
+        self._file_stamp = None
         self.load_config()
     
     def load_config(self):
-        """Load configuration from YAML file"""
-        if not os.path.exists(self.config_path):
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
+        """Load configuration from YAML file (skipped if the file is unchanged since the last load)"""
+        try:
+            stat = os.stat(self.config_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {self.config_path}") from None
+        # mtime alone misses an edit within one timestamp tick or a copy that kept its
+        # mtime; the size and inode catch most of those
+        stamp = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if stamp == self._file_stamp:
+            return
         
         with open(self.config_path, 'r') as file:
-            self._config = yaml.safe_load(file)
+            self._config = yaml.load(file, Loader=_SafeLoader)
+        self._file_stamp = stamp
+        
+        config = self._config
+        self.probability_factors = config.get('probability_factors', {})
+        self.hit_type_weights = config.get('hit_type_weights', {})
+        self.player_development = config.get('player_development', {})
+        self.fatigue = config.get('fatigue', {})
+        self.positive_event_chance = config.get('positive_event_chance', 0.12)
+        self.negative_event_chance = config.get('negative_event_chance', 0.08)
+        self.game_balance = config.get('game_balance', {})
+        self.development_curves = config.get('development_curves', {})
+        self.experience_thresholds = config.get('experience_thresholds', {})
     
     def reload_config(self):
         """Reload configuration from file (useful for runtime changes)"""
         self.load_config()
-    
-    @property
-    def probability_factors(self) -> Dict[str, float]:
-        """Get probability factors"""
-        return self._config.get('probability_factors', {})
-    
-    @property
-    def hit_type_weights(self) -> Dict[str, float]:
-        """Get hit type weights"""
-        return self._config.get('hit_type_weights', {})
-    
-    @property
-    def player_development(self) -> Dict[str, Any]:
-        """Get player development parameters"""
-        return self._config.get('player_development', {})
-    
-    @property
-    def fatigue(self) -> Dict[str, float]:
-        """Get fatigue parameters"""
-        return self._config.get('fatigue', {})
-    
-    @property
-    def positive_event_chance(self) -> float:
-        """Get positive event chance"""
-        return self._config.get('positive_event_chance', 0.12)
-    
-    @property
-    def negative_event_chance(self) -> float:
-        """Get negative event chance"""
-        return self._config.get('negative_event_chance', 0.08)
-    
-    @property
-    def game_balance(self) -> Dict[str, Any]:
-        """Get game balance parameters"""
-        return self._config.get('game_balance', {})
-    
-    @property
-    def development_curves(self) -> Dict[str, Any]:
-        """Get development curve parameters"""
-        return self._config.get('development_curves', {})
-    
-    @property
-    def experience_thresholds(self) -> Dict[str, Any]:
-        """Get experience threshold parameters"""
-        return self._config.get('experience_thresholds', {})
 
 # Global config instance
 _config_instance = None
@@ -1,6 +1,7 @@
 """
 Game constants and configuration values for MLW Wiffle Ball
 """
+from types import MappingProxyType
 
 # Game Information
 GAME_TITLE = "Wiffle Ball Manager"
@@ -12,6 +13,9 @@ MAX_PLAYERS_PER_TEAM = 8  # 6 active + 2 reserve
 ACTIVE_PLAYERS_PER_TEAM = 6
 RESERVE_PLAYERS_PER_TEAM = 2
 GAMES_PER_SEASON = 15  # 5 series of 3 games each
+# Qualifiers for the AVG and ERA leaders, on the team screens and in the season titles
+LEADER_MIN_AB = 2 * GAMES_PER_SEASON
+LEADER_MIN_IP = GAMES_PER_SEASON
 INNINGS_PER_GAME = 3
 PLAYOFF_TEAMS_PER_DIVISION = 3
 
@@ -28,8 +32,8 @@ PLAYERS_ON_FIELD = 3  # including pitcher
 MIN_ATTRIBUTE = 1
 MAX_ATTRIBUTE = 100
 
-# Player Types
-PLAYER_TYPES = {
+# Player Types (lookup tables are read-only views so they can't be changed at runtime)
+PLAYER_TYPES = MappingProxyType({
     "PITCHER": "P",
     "CATCHER": "C", 
     "FIRST_BASE": "1B",
@@ -40,7 +44,7 @@ PLAYER_TYPES = {
     "CENTER_FIELD": "CF",
     "RIGHT_FIELD": "RF",
     "DESIGNATED_HITTER": "DH"
-}
+})
 
 # MLW-Specific Player Attributes
 PITCHER_ATTRIBUTES = ["velocity", "control", "stamina", "speed_control"]
@@ -49,7 +53,7 @@ FIELDER_ATTRIBUTES = ["range", "arm_strength", "accuracy"]
 MENTAL_ATTRIBUTES = ["leadership", "clutch", "work_ethic"]
 
 # Game States
-GAME_STATES = {
+GAME_STATES = MappingProxyType({
     "MAIN_MENU": "main_menu",
     "NEW_GAME": "new_game",
     "LOAD_GAME": "load_game",
@@ -60,7 +64,8 @@ GAME_STATES = {
     "TRADE_MENU": "trade_menu",
     "SETTINGS": "settings",
     "QUIT": "quit"
-}
+})
+VALID_GAME_STATES = frozenset(GAME_STATES.values())
 
 # MLW Season Structure
 SEASON_STRUCTURE = {
@@ -79,7 +84,7 @@ PLAYOFF_STRUCTURE = {
 }
 
 # Colors for UI
-COLORS = {
+COLORS = MappingProxyType({
     "TITLE": "bold blue",
     "SUBTITLE": "cyan",
     "SUCCESS": "green",
@@ -88,7 +93,7 @@ COLORS = {
     "INFO": "white",
     "HIGHLIGHT": "bold white",
     "DIM": "dim"
-}
+})
 
 # File Paths
 SAVE_DIR = "data/saves"
@@ -4,12 +4,136 @@ Handles migration from v1.0 to v2.0 format with new attributes and advanced stat
 """
 import os
 import json
-import shutil
-from datetime import datetime
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 import random
 
+# orjson parses and serializes in C; fall back to the stdlib json module without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json(path) -> Any:
+    """Read a JSON document from ``path``"""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _dump_json(data: Any, path) -> None:
+    """Write ``data`` to ``path`` as JSON indented by two spaces"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    # json.dump writes every small encoder chunk separately; encode once, write once
+    Path(path).write_text(json.dumps(data, indent=2))
+
+
+# v2.0 stat fields and their defaults as (key, value) pairs, built once; players get
+# missing fields filled from these and fresh career totals copied from them
+_EMPTY_BATTING_ITEMS = (
+    ('gp', 0), ('gs', 0), ('pa', 0), ('ab', 0), ('r', 0), ('h', 0),
+    ('doubles', 0), ('triples', 0), ('hr', 0), ('rbi', 0), ('bb', 0),
+    ('k', 0), ('hbp', 0), ('ibb', 0), ('lob', 0), ('tb', 0),
+    ('obp', 0.0), ('slg', 0.0), ('ops', 0.0)
+)
+_EMPTY_PITCHING_ITEMS = (
+    ('gp', 0), ('gs', 0), ('ip', 0.0), ('r', 0), ('er', 0), ('h', 0),
+    ('bb', 0), ('hbp', 0), ('ibb', 0), ('k', 0), ('cg', 0), ('w', 0),
+    ('l', 0), ('s', 0), ('hld', 0), ('bs', 0), ('pt', 0), ('b', 0),
+    ('st', 0), ('wp', 0)
+)
+_EMPTY_FIELDING_ITEMS = (
+    ('po', 0), ('a', 0), ('e', 0), ('dp', 0), ('fpct', 1.0)
+)
+
+# Each player stats dict with the v2.0 fields it must have
+_STATS_DEFAULTS = (
+    ('batting_stats', _EMPTY_BATTING_ITEMS),
+    ('pitching_stats', _EMPTY_PITCHING_ITEMS),
+    ('fielding_stats', _EMPTY_FIELDING_ITEMS)
+)
+
+# Player ratings that are clamped to the 1-100 range
+_ATTR_SET = frozenset({
+    'power', 'contact', 'discipline', 'speed',
+    'velocity', 'movement', 'control', 'stamina', 'deception',
+    'range', 'arm_strength', 'hands', 'reaction', 'accuracy',
+    'potential', 'leadership', 'work_ethic', 'durability',
+    'clutch', 'composure'
+})
+
+# Fields a v2.0 player and its career_stats must have
+_REQUIRED_PLAYER_FIELDS = frozenset({
+    'name', 'clutch', 'composure', 'height', 'weight',
+    'career_stats', 'seasons_played'
+})
+_REQUIRED_CAREER_FIELDS = frozenset({
+    'season_batting', 'season_pitching', 'season_fielding',
+    'career_batting', 'career_pitching', 'career_fielding'
+})
+
+# Directories with fewer saves than this are migrated in-process; below it the cost of
+# starting worker processes outweighs migrating the files in parallel
+_PARALLEL_MIN_FILES = 4
+
+
+def _clamp_ratings(player: Dict[str, Any]) -> None:
+    """Clamp the ratings a player has to the 1-100 range"""
+    for attr in _ATTR_SET & player.keys():
+        v = player[attr]
+        player[attr] = 1 if v < 1 else 100 if v > 100 else v
+
+
+def _fill_stats(player: Dict[str, Any]) -> None:
+    """Add any missing v2.0 fields to the player's batting, pitching and fielding stats"""
+    for stats_key, items in _STATS_DEFAULTS:
+        stats = player.get(stats_key)
+        if stats is not None:
+            for key, default_value in items:
+                stats.setdefault(key, default_value)
+
+
+def _prefill_random(n: int, seed: Optional[int] = None) -> Dict[str, list]:
+    """
+    Draw the random variation for n migrated players in one call per field
+    
+    Values are converted to plain Python numbers so they serialize like the scalar
+    path's. Without a ``seed`` one is taken from the random module, so random.seed()
+    keeps migrations reproducible. Without NumPy the same fields are drawn with
+    random.Random.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    try:
+        import numpy as np
+    except ImportError:
+        rng = random.Random(seed)
+        return {
+            'clutch_var': [rng.randint(-10, 10) for _ in range(n)],
+            'composure_var': [rng.randint(-8, 8) for _ in range(n)],
+            'height': [rng.randint(66, 78) for _ in range(n)],
+            'bmi': [rng.uniform(20, 28) for _ in range(n)]
+        }
+    
+    rng = np.random.default_rng(seed)
+    return {
+        'clutch_var': rng.integers(-10, 11, size=n).tolist(),
+        'composure_var': rng.integers(-8, 9, size=n).tolist(),
+        'height': rng.integers(66, 79, size=n).tolist(),
+        'bmi': rng.uniform(20, 28, size=n).tolist()
+    }
+
+
+def _backup_timestamp() -> str:
+    """Current time formatted for backup file names"""
+    from datetime import datetime
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
 class SaveFileMigrator:
     """Handles migration of save files between versions"""
     
@@ -18,62 +142,87 @@ class SaveFileMigrator:
         self.backup_dir = self.save_dir / "backups"
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         
-    def migrate_v1_to_v2(self, save_file_path: str) -> Dict[str, Any]:
+    def migrate_v1_to_v2(self, save_file_path: str, backup: bool = True,
+                         backup_timestamp: Optional[str] = None, seed: Optional[int] = None) -> Dict[str, Any]:
         """
         Migrate a v1.0 save file to v2.0 format
         
         Args:
             save_file_path: Path to the v1.0 save file
+            backup: Copy the file into backup_dir first; callers that leave the
+                original file in place (migrate_directory) can skip the copy
+            backup_timestamp: Timestamp for the backup name; defaults to now
+            seed: Seed for the players' random variation; taken from the random
+                module if None
             
         Returns:
             Dictionary containing the migrated save data
         """
+        from datetime import datetime
+        
         # Create backup first
-        self._create_backup(save_file_path)
+        if backup:
+            self._create_backup(save_file_path, backup_timestamp)
         
-        with open(save_file_path, 'r') as f:
-            data = json.load(f)
+        data = _load_json(save_file_path)
         
         # Update version info
         data['game_version'] = '2.0'
         data['migration_date'] = datetime.now().isoformat()
         data['migrated_from'] = data.get('game_version', '1.0')
         
-        # Migrate players
-        if 'teams' in data:
-            for team in data['teams']:
-                if 'players' in team:
-                    for player in team['players']:
-                        self._migrate_player_v1_to_v2(player)
+        players = [
+            player
+            for team in data.get('teams', ())
+            for player in team.get('players', ())
+        ]
         
         # Migrate standalone players list if it exists
-        if 'players' in data:
-            for player in data['players']:
-                self._migrate_player_v1_to_v2(player)
+        players.extend(data.get('players', ()))
+        
+        # Migrate players, drawing everyone's random variation up front
+        draws = _prefill_random(len(players), seed)
+        for index, player in enumerate(players):
+            self._migrate_player_v1_to_v2(player, draws, index)
                 
         return data
     
-    def _migrate_player_v1_to_v2(self, player: Dict[str, Any]) -> None:
+    def _migrate_player_v1_to_v2(self, player: Dict[str, Any],
+                                 draws: Optional[Dict[str, list]] = None, index: int = 0) -> None:
         """
         Migrate a single player from v1.0 to v2.0 format
         
         Args:
             player: Player dictionary to migrate (modified in place)
+            draws: Pre-drawn random values from _prefill_random; drawn one at a time if None
+            index: This player's position in draws
         """
+        if draws is None:
+            clutch_var = composure_var = height = bmi = None
+        else:
+            clutch_var = draws['clutch_var'][index]
+            composure_var = draws['composure_var'][index]
+            height = draws['height'][index]
+            bmi = draws['bmi'][index]
+        
+        # Collect the fields this player is missing and add them in one update
+        patch = {}
+        
         # Add new mental attributes with sensible defaults based on existing attributes
-        player.setdefault('clutch', self._calculate_clutch_default(player))
-        player.setdefault('composure', self._calculate_composure_default(player))
+        if 'clutch' not in player:
+            patch['clutch'] = self._calculate_clutch_default(player, clutch_var)
+        if 'composure' not in player:
+            patch['composure'] = self._calculate_composure_default(player, composure_var)
         
         # Add physical attributes with realistic variation
-        player.setdefault('height', self._generate_height())
-        player.setdefault('weight', self._generate_weight(player.get('height', 70)))
-        
-        # Ensure all existing attributes have reasonable bounds
-        self._normalize_attributes(player)
+        if 'height' not in player:
+            patch['height'] = self._generate_height(height)
+        if 'weight' not in player:
+            patch['weight'] = self._generate_weight(patch.get('height', player.get('height', 70)), bmi)
         
         # Add career stats structure if not present
         if 'career_stats' not in player:
-            player['career_stats'] = {
+            patch['career_stats'] = {
                 'season_batting': {},
                 'season_pitching': {},
                 'season_fielding': {},
@@ -83,18 +232,19 @@ class SaveFileMigrator:
             }
         
         # Add seasons_played list if not present
-        player.setdefault('seasons_played', [])
+        if 'seasons_played' not in player:
+            patch['seasons_played'] = []
         
-        # Update batting stats to include new fields
-        self._update_batting_stats(player.get('batting_stats', {}))
+        if patch:
+            player.update(patch)
         
-        # Update pitching stats to include new fields  
-        self._update_pitching_stats(player.get('pitching_stats', {}))
+        # Ensure all existing attributes have reasonable bounds
+        _clamp_ratings(player)
         
-        # Update fielding stats to include new fields
-        self._update_fielding_stats(player.get('fielding_stats', {}))
+        # Update batting, pitching and fielding stats to include new fields
+        _fill_stats(player)
     
-    def _calculate_clutch_default(self, player: Dict[str, Any]) -> int:
+    def _calculate_clutch_default(self, player: Dict[str, Any], variation: Optional[int] = None) -> int:
         """Calculate a reasonable clutch rating based on existing attributes"""
         # Base clutch on mental attributes if they exist
         leadership = player.get('leadership', 50)
@@ -104,11 +254,13 @@ class SaveFileMigrator:
         base_clutch = (leadership + work_ethic) // 2
         
         # Add some random variation (-10 to +10)
-        variation = random.randint(-10, 10)
+        if variation is None:
+            variation = random.randint(-10, 10)
         
-        return max(1, min(100, base_clutch + variation))
+        clutch = base_clutch + variation
+        return 1 if clutch < 1 else 100 if clutch > 100 else clutch
     
-    def _calculate_composure_default(self, player: Dict[str, Any]) -> int:
+    def _calculate_composure_default(self, player: Dict[str, Any], variation: Optional[int] = None) -> int:
         """Calculate a reasonable composure rating based on existing attributes"""
         # Base composure on control and discipline if they exist
         control = player.get('control', 50)
@@ -118,89 +270,60 @@ class SaveFileMigrator:
         base_composure = (control + discipline) // 2
         
         # Add some random variation (-8 to +8)
-        variation = random.randint(-8, 8)
+        if variation is None:
+            variation = random.randint(-8, 8)
         
-        return max(1, min(100, base_composure + variation))
+        composure = base_composure + variation
+        return 1 if composure < 1 else 100 if composure > 100 else composure
     
-    def _generate_height(self) -> int:
+    def _generate_height(self, height: Optional[int] = None) -> int:
         """Generate a realistic height in inches (5'6" to 6'6")"""
-        return random.randint(66, 78)  # 66-78 inches
+        if height is None:
+            height = random.randint(66, 78)  # 66-78 inches
+        return height
     
-    def _generate_weight(self, height: int) -> int:
+    def _generate_weight(self, height: int, target_bmi: Optional[float] = None) -> int:
         """Generate a realistic weight based on height"""
         # Basic BMI-based weight calculation
         # Target BMI between 20-28 for athletes
         height_meters = height * 0.0254
-        target_bmi = random.uniform(20, 28)
+        if target_bmi is None:
+            target_bmi = random.uniform(20, 28)
         weight_kg = target_bmi * (height_meters ** 2)
         weight_lbs = int(weight_kg * 2.20462)
         
-        return max(140, min(280, weight_lbs))  # Reasonable bounds
-    
-    def _normalize_attributes(self, player: Dict[str, Any]) -> None:
-        """Ensure all attributes are within valid ranges (1-100)"""
-        attributes = [
-            'power', 'contact', 'discipline', 'speed',
-            'velocity', 'movement', 'control', 'stamina', 'deception',
-            'range', 'arm_strength', 'hands', 'reaction', 'accuracy',
-            'potential', 'leadership', 'work_ethic', 'durability',
-            'clutch', 'composure'
-        ]
-        
-        for attr in attributes:
-            if attr in player:
-                player[attr] = max(1, min(100, player[attr]))
+        # Reasonable bounds
+        return 140 if weight_lbs < 140 else 280 if weight_lbs > 280 else weight_lbs
     
     def _empty_batting_stats(self) -> Dict[str, Any]:
         """Return empty batting stats structure"""
-        return {
-            'gp': 0, 'gs': 0, 'pa': 0, 'ab': 0, 'r': 0, 'h': 0,
-            'doubles': 0, 'triples': 0, 'hr': 0, 'rbi': 0, 'bb': 0,
-            'k': 0, 'hbp': 0, 'ibb': 0, 'lob': 0, 'tb': 0,
-            'obp': 0.0, 'slg': 0.0, 'ops': 0.0
-        }
+        return dict(_EMPTY_BATTING_ITEMS)
     
     def _empty_pitching_stats(self) -> Dict[str, Any]:
         """Return empty pitching stats structure"""
-        return {
-            'gp': 0, 'gs': 0, 'ip': 0.0, 'r': 0, 'er': 0, 'h': 0,
-            'bb': 0, 'hbp': 0, 'ibb': 0, 'k': 0, 'cg': 0, 'w': 0,
-            'l': 0, 's': 0, 'hld': 0, 'bs': 0, 'pt': 0, 'b': 0,
-            'st': 0, 'wp': 0
-        }
+        return dict(_EMPTY_PITCHING_ITEMS)
     
     def _empty_fielding_stats(self) -> Dict[str, Any]:
         """Return empty fielding stats structure"""
-        return {
-            'po': 0, 'a': 0, 'e': 0, 'dp': 0, 'fpct': 1.0
-        }
-    
-    def _update_batting_stats(self, batting_stats: Dict[str, Any]) -> None:
-        """Update batting stats to include all v2.0 fields"""
-        defaults = self._empty_batting_stats()
-        for key, default_value in defaults.items():
-            batting_stats.setdefault(key, default_value)
+        return dict(_EMPTY_FIELDING_ITEMS)
     
-    def _update_pitching_stats(self, pitching_stats: Dict[str, Any]) -> None:
-        """Update pitching stats to include all v2.0 fields"""
-        defaults = self._empty_pitching_stats()
-        for key, default_value in defaults.items():
-            pitching_stats.setdefault(key, default_value)
-    
-    def _update_fielding_stats(self, fielding_stats: Dict[str, Any]) -> None:
-        """Update fielding stats to include all v2.0 fields"""
-        defaults = self._empty_fielding_stats()
-        for key, default_value in defaults.items():
-            fielding_stats.setdefault(key, default_value)
-    
-    def _create_backup(self, save_file_path: str) -> str:
-        """Create a backup of the original save file"""
+    def _create_backup(self, save_file_path: str, timestamp: Optional[str] = None) -> str:
+        """Create a backup of the original save file, named with ``timestamp`` (default: now)"""
+        import shutil
+        
         save_path = Path(save_file_path)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = _backup_timestamp()
         backup_name = f"{save_path.stem}_backup_{timestamp}{save_path.suffix}"
         backup_path = self.backup_dir / backup_name
         
-        shutil.copy2(save_file_path, backup_path)
+        # Fallback for a name already taken: number repeat backups within one timestamp
+        counter = 0
+        while backup_path.exists():
+            counter += 1
+            backup_path = self.backup_dir / f"{save_path.stem}_backup_{timestamp}_{counter}{save_path.suffix}"
+        
+        shutil.copyfile(save_file_path, backup_path)
         return str(backup_path)
     
     def migrate_directory(self, input_dir: str, output_dir: str) -> List[str]:
@@ -224,24 +347,63 @@ class SaveFileMigrator:
             print(f"Input directory {input_dir} does not exist")
             return migrated_files
         
-        for save_file in input_path.glob("*.json"):
-            try:
-                # Migrate the file
-                migrated_data = self.migrate_v1_to_v2(str(save_file))
-                
-                # Save to output directory
-                output_file = output_path / save_file.name
-                with open(output_file, 'w') as f:
-                    json.dump(migrated_data, f, indent=2)
-                
-                migrated_files.append(str(output_file))
-                print(f"Successfully migrated {save_file.name}")
-                
-            except Exception as e:
-                print(f"Error migrating {save_file.name}: {str(e)}")
+        with os.scandir(input_dir) as entries:
+            save_files = [entry.path for entry in entries if entry.name.endswith('.json') and entry.is_file()]
+        
+        # The v1.0 files stay in input_dir, so they only need backing up when the
+        # migrated files are written over them
+        backup = os.path.samefile(input_dir, output_dir)
+        # Every backup from one run shares a timestamp, formatted once here
+        timestamp = _backup_timestamp() if backup else None
+        # Per-file seeds come from this process's random state: forked workers share
+        # it, and random.seed() then reproduces the whole run
+        seeds = [random.getrandbits(64) for _ in save_files]
+        
+        # Each file is an independent parse/migrate/write, so larger directories are
+        # spread over worker processes; results are reported in directory order
+        if len(save_files) < _PARALLEL_MIN_FILES:
+            results = [
+                self._try_migrate_file(save_file, output_dir, backup, timestamp, seed)
+                for save_file, seed in zip(save_files, seeds)
+            ]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            workers = min(os.cpu_count() or 1, len(save_files))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._try_migrate_file, save_file, output_dir, backup, timestamp, seed)
+                    for save_file, seed in zip(save_files, seeds)
+                ]
+                results = [future.result() for future in futures]
+        
+        for save_file, (output_file, error) in zip(save_files, results):
+            if error is None:
+                migrated_files.append(output_file)
+                print(f"Successfully migrated {os.path.basename(save_file)}")
+            else:
+                print(f"Error migrating {os.path.basename(save_file)}: {error}")
         
         return migrated_files
     
+    def _try_migrate_file(self, save_file: str, output_dir: str, backup: bool = True,
+                          backup_timestamp: Optional[str] = None, seed: Optional[int] = None) -> tuple:
+        """
+        Migrate one save file into output_dir
+        
+        Returns (output file path, None) on success or (None, error message) on failure.
+        """
+        try:
+            migrated_data = self.migrate_v1_to_v2(save_file, backup, backup_timestamp, seed)
+            
+            # Save to output directory
+            output_file = os.path.join(output_dir, os.path.basename(save_file))
+            _dump_json(migrated_data, output_file)
+            return output_file, None
+            
+        except Exception as e:
+            return None, str(e)
+    
     def validate_v2_save(self, save_file_path: str) -> bool:
         """
         Validate that a save file is in proper v2.0 format
@@ -253,8 +415,7 @@ class SaveFileMigrator:
             True if valid, False otherwise
         """
         try:
-            with open(save_file_path, 'r') as f:
-                data = json.load(f)
+            data = _load_json(save_file_path)
             
             # Check version
             if data.get('game_version') != '2.0':
@@ -275,27 +436,8 @@ class SaveFileMigrator:
     
     def _validate_player_v2(self, player: Dict[str, Any]) -> bool:
         """Validate that a player has all required v2.0 fields"""
-        required_fields = [
-            'name', 'clutch', 'composure', 'height', 'weight',
-            'career_stats', 'seasons_played'
-        ]
-        
-        for field in required_fields:
-            if field not in player:
-                return False
-        
-        # Validate career_stats structure
-        career_stats = player.get('career_stats', {})
-        required_career_fields = [
-            'season_batting', 'season_pitching', 'season_fielding',
-            'career_batting', 'career_pitching', 'career_fielding'
-        ]
-        
-        for field in required_career_fields:
-            if field not in career_stats:
-                return False
-        
-        return True
+        return (_REQUIRED_PLAYER_FIELDS.issubset(player)
+                and _REQUIRED_CAREER_FIELDS.issubset(player.get('career_stats', {})))
 
 
 def main():
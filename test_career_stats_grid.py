@@ -7,7 +7,7 @@ sys.path.insert(0, './src')
 from models.player import Player, BattingStats, PitchingStats, FieldingStats
 from ui.team_management import TeamManagementUI
 from rich.console import Console
-import random
+import numpy as np
 
 def create_player_with_career_stats():
     """Create a player with multi-season career stats"""
@@ -26,36 +26,27 @@ def create_player_with_career_stats():
         accuracy=79
     )
     
-    # Simulate 3 seasons of stats
+    # Simulate 3 seasons of stats, drawing each season's stats in one call per kind
+    # from a seeded generator so the career totals are the same on every run
+    rng = np.random.default_rng(seed=0)
     for season in range(1, 4):
         # Create season batting stats
         batting = BattingStats()
-        batting.gp = random.randint(12, 15)
-        batting.ab = random.randint(40, 60)
-        batting.h = random.randint(10, 25)
-        batting.hr = random.randint(1, 6)
-        batting.rbi = random.randint(5, 15)
-        batting.bb = random.randint(3, 12)
-        batting.k = random.randint(8, 20)
+        (batting.gp, batting.ab, batting.h, batting.hr,
+         batting.rbi, batting.bb, batting.k) = rng.integers(
+            [12, 40, 10, 1, 5, 3, 8], [15, 60, 25, 6, 15, 12, 20], endpoint=True).tolist()
         
         # Create season pitching stats
         pitching = PitchingStats()
-        pitching.gp = random.randint(8, 12)
-        pitching.gs = random.randint(3, 8)
-        pitching.ip = random.randint(15, 35) + random.random()
-        pitching.w = random.randint(1, 6)
-        pitching.l = random.randint(1, 5)
-        pitching.k = random.randint(8, 25)
-        pitching.bb = random.randint(3, 12)
-        pitching.er = random.randint(2, 12)
-        pitching.h = random.randint(8, 20)
+        (pitching.gp, pitching.gs, ip, pitching.w, pitching.l,
+         pitching.k, pitching.bb, pitching.er, pitching.h) = rng.integers(
+            [8, 3, 15, 1, 1, 8, 3, 2, 8], [12, 8, 35, 6, 5, 25, 12, 12, 20], endpoint=True).tolist()
+        pitching.ip = ip + rng.random()
         
         # Create season fielding stats
         fielding = FieldingStats()
-        fielding.po = random.randint(5, 20)
-        fielding.a = random.randint(3, 15)
-        fielding.e = random.randint(0, 3)
-        fielding.dp = random.randint(0, 2)
+        fielding.po, fielding.a, fielding.e, fielding.dp = rng.integers(
+            [5, 3, 0, 0], [20, 15, 3, 2], endpoint=True).tolist()
         
         # Add to career stats
         player.career_stats.add_season_stats(season, batting, pitching, fielding)
@@ -116,5 +107,29 @@ def test_career_stats_display():
         import traceback
         traceback.print_exc()
 
+def test_career_totals_include_current_season():
+    """Career totals should add the in-progress season and follow later stat changes"""
+    player = create_player_with_career_stats()
+    career = player.career_stats.career_batting
+    
+    player.batting_stats.ab = 10
+    player.batting_stats.h = 4
+    totals = player.career_stats.batting_totals(player.batting_stats)
+    assert (totals.ab, totals.h) == (career.ab + 10, career.h + 4)
+    totals.h += 1  # A fresh stat line each call, so edits don't reach the next one
+    assert player.career_stats.batting_totals(player.batting_stats).h == career.h + 4
+    
+    player.batting_stats.h = 5
+    assert player.career_stats.batting_totals(player.batting_stats).h == career.h + 5
+    assert player.career_stats.batting_totals().ab == career.ab
+    
+    player.pitching_stats.ip = 3.0
+    player.pitching_stats.er = 1
+    totals = player.career_stats.pitching_totals(player.pitching_stats)
+    assert (totals.ip, totals.er) == (player.career_stats.career_pitching.ip + 3.0, player.career_stats.career_pitching.er + 1)
+    
+    print("✓ Career totals include the current season and refresh when stats change")
+
 if __name__ == "__main__":
-    test_career_stats_display()
\ No newline at end of file
+    test_career_stats_display()
+    test_career_totals_include_current_season()
\ No newline at end of file
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Test script to verify skill model config reloads only when the file changes"""
+
+import sys
+sys.path.insert(0, './src')
+sys.path.insert(0, '.')
+
+import os
+import tempfile
+from src.utils.config_loader import SkillModelConfig
+
+def test_reload_skips_unchanged_file():
+    """Reloading an unchanged file keeps the parsed config; an edited file is parsed again"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "skill_model.yml")
+        with open(path, "w") as f:
+            f.write("positive_event_chance: 0.2\n")
+
+        config = SkillModelConfig(path)
+        parsed = config._config
+        assert config.positive_event_chance == 0.2
+
+        config.reload_config()
+        assert config._config is parsed, "Unchanged file should not be parsed again"
+
+        with open(path, "w") as f:
+            f.write("positive_event_chance: 0.3\n")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        config.reload_config()
+        assert config.positive_event_chance == 0.3, "Edited file should be reloaded"
+
+        # An edit that keeps the old mtime is still caught by the size change
+        stat = os.stat(path)
+        with open(path, "w") as f:
+            f.write("positive_event_chance: 0.35\n")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        config.reload_config()
+        assert config.positive_event_chance == 0.35, "Edit with the same mtime should be reloaded"
+
+    print("✓ Config reload skips unchanged files and picks up edits")
+
+def test_missing_config_file():
+    """A missing config file still raises FileNotFoundError"""
+    try:
+        SkillModelConfig("does/not/exist.yml")
+    except FileNotFoundError as e:
+        assert "does/not/exist.yml" in str(e)
+    else:
+        raise AssertionError("Missing config file should raise")
+
+    print("✓ Missing config file raises FileNotFoundError")
+
+if __name__ == "__main__":
+    test_reload_skips_unchanged_file()
+    test_missing_config_file()
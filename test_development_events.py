@@ -12,6 +12,9 @@ from simulation.season_diary import SeasonDiary
 from simulation.player_dev import PlayerDevelopment
 import random
 
+# Attributes whose changes are reported after each cycle's events, in snapshot order
+_DIFF_ATTRS = ('velocity', 'control', 'power', 'contact', 'stamina')
+
 def create_test_players():
     """Create a few test players with different profiles"""
     players = []
@@ -122,13 +125,7 @@ def test_development_events():
             print(f"\nProcessing {player.name}:")
             
             # Store original attributes
-            original_attrs = {
-                'velocity': player.velocity,
-                'control': player.control,
-                'power': player.power,
-                'contact': player.contact,
-                'stamina': player.stamina
-            }
+            original_attrs = (player.velocity, player.control, player.power, player.contact, player.stamina)
             
             # Process development events
             events = dev_system.process_player_events(
@@ -145,8 +142,8 @@ def test_development_events():
                 
                 # Show attribute changes
                 changes = []
-                for attr, original in original_attrs.items():
-                    current = getattr(player, attr)
+                current_attrs = (player.velocity, player.control, player.power, player.contact, player.stamina)
+                for attr, original, current in zip(_DIFF_ATTRS, original_attrs, current_attrs):
                     if current != original:
                         diff = current - original
                         changes.append(f"{attr}: {original}→{current} ({diff:+d})")
@@ -235,12 +232,34 @@ def test_player_development_integration():
         if hasattr(entry, 'entry_type') and 'development' in str(entry.entry_type).lower():
             print(f"  {entry.get_display_summary()}")
 
+def test_shared_events_are_read_only():
+    """Event tables are shared by every DevelopmentEventSystem, so events can't be changed"""
+    from dataclasses import FrozenInstanceError
+    
+    first, second = DevelopmentEventSystem(), DevelopmentEventSystem()
+    assert first.positive_events is second.positive_events
+    
+    event = first.positive_events[0]
+    try:
+        event.duration = 3
+        assert False, "Events should be frozen"
+    except FrozenInstanceError:
+        pass
+    try:
+        event.attribute_changes["power"] = (10, 20)
+        assert False, "Attribute ranges should be read-only"
+    except TypeError:
+        pass
+    
+    print("✓ Shared development events are read-only")
+
 if __name__ == "__main__":
     # Set random seed for reproducible results
     random.seed(42)
     
     test_development_events()
     test_player_development_integration()
+    test_shared_events_are_read_only()
     
     print(f"\n{'='*60}")
     print("ALL TESTS COMPLETED SUCCESSFULLY!")
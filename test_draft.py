@@ -1,15 +1,20 @@
 #!/usr/bin/env python3
-"""Test script to verify the 1-round draft functionality"""
+"""Test script to verify the 1-round draft functionality
 
+Set WBM_VERBOSE_ERRORS=1 to print the traceback of a failure.
+"""
+
+import os
 import sys
 sys.path.insert(0, './src')
 
-from game.engine import GameEngine
-from ui.menus import MainMenu
-from rich.console import Console
-
 def test_draft():
     """Test the draft functionality by simulating a season"""
+    # The engine and menus load Rich, so every heavy import waits for the test to run
+    from game.engine import GameEngine
+    from ui.menus import MainMenu
+    from rich.console import Console
+    
     console = Console()
     engine = GameEngine()
     
@@ -53,13 +58,14 @@ def test_draft():
         # Verify roster sizes after draft
         console.print("\nRoster sizes after draft:")
         for team in teams[:3]:
-            players = team.get_all_players()
-            console.print(f"{team.name}: {len(players)} players")
+            player_count = len(team.active_roster) + len(team.reserve_roster)
+            console.print(f"{team.name}: {player_count} players")
             
     except Exception as e:
         console.print(f"[red]✗ Draft failed: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        if os.getenv("WBM_VERBOSE_ERRORS"):
+            import traceback
+            traceback.print_exc()
 
 if __name__ == "__main__":
     test_draft()
\ No newline at end of file
@@ -1,48 +1,60 @@
 #!/usr/bin/env python3
-"""Direct test of the 1-round draft functionality"""
+"""Direct test of the 1-round draft functionality
 
+Set WBM_VERBOSE_ERRORS=1 to print the traceback of a failure.
+"""
+
+import os
 import sys
 sys.path.insert(0, './src')
 
 from simulation.season_sim import SeasonSimulator
 from models.team import Team
 from models.player import Player, BattingStats, PitchingStats
-from rich.console import Console
-import random
 
 def create_test_teams():
     """Create a few test teams with players"""
+    import numpy as np
+    
     teams = []
     
+    # One draw per team covers every player's age, ratings and stats; the columns are
+    # age, velocity, control, stamina, speed_control, range, arm_strength, accuracy, ab, h
+    rng = np.random.default_rng()
+    
     # Create 4 test teams
     for i in range(4):
         team = Team(f"Team {i+1}")
         
         # Add some players to each team
-        for j in range(6):  # 6 players per team (active roster size)
+        rows = rng.integers([20, 30, 30, 30, 30, 40, 40, 40, 20, 5],
+                            [35, 80, 80, 80, 80, 85, 85, 85, 50, 25],
+                            size=(6, 10), endpoint=True).tolist()  # 6 players per team (active roster size)
+        for j, (age, velocity, control, stamina, speed_control,
+                range_rating, arm_strength, accuracy, ab, h) in enumerate(rows):
             # Create varied players with different skill levels
             player = Player(
                 name=f"Player {j+1}",
-                age=random.randint(20, 35),
-                velocity=random.randint(30, 80),
-                control=random.randint(30, 80), 
-                stamina=random.randint(30, 80),
-                speed_control=random.randint(30, 80),
-                range=random.randint(40, 85),
-                arm_strength=random.randint(40, 85),
-                accuracy=random.randint(40, 85)
+                age=age,
+                velocity=velocity,
+                control=control,
+                stamina=stamina,
+                speed_control=speed_control,
+                range=range_rating,
+                arm_strength=arm_strength,
+                accuracy=accuracy
             )
             
             # Add some stats to make the value calculation work
             batting = BattingStats()
-            batting.ab = random.randint(20, 50)
-            batting.h = random.randint(5, 25)
+            batting.ab = ab
+            batting.h = h
             player.batting_stats = batting
             
             team.add_player(player, active=True)
         
         # Set some wins/losses for draft order
-        team.wins = random.randint(5, 12)
+        team.wins = int(rng.integers(5, 12, endpoint=True))
         team.losses = 15 - team.wins
         
         teams.append(team)
@@ -51,6 +63,8 @@ def create_test_teams():
 
 def test_draft_direct():
     """Test the draft functionality directly"""
+    from rich.console import Console
+    
     console = Console()
     
     console.print("\n[bold]Testing 1-Round Draft System (Direct)[/bold]\n")
@@ -60,22 +74,25 @@ def test_draft_direct():
     console.print(f"[green]✓ Created {len(teams)} test teams[/green]")
     
     # Show team records for draft order
-    console.print("\nTeam records:")
+    # Per-team lines are collected and printed as one block
+    lines = ["\nTeam records:"]
     for team in teams:
-        players = team.get_all_players()
-        console.print(f"{team.name}: {team.wins}-{team.losses} ({len(players)} players)")
+        player_count = len(team.active_roster) + len(team.reserve_roster)
+        lines.append(f"{team.name}: {team.wins}-{team.losses} ({player_count} players)")
+    console.print("\n".join(lines))
     
     # Create season simulator
     season_sim = SeasonSimulator(teams)
     console.print("[green]✓ Created season simulator[/green]")
     
     # Show initial player values
-    console.print("\nInitial player values (showing worst player per team):")
+    lines = ["\nInitial player values (showing worst player per team):"]
     for team in teams:
         worst_player = season_sim.find_worst_player(team)
         if worst_player:
             value = season_sim.calculate_player_value(worst_player)
-            console.print(f"{team.name}: {worst_player.name} (Value: {value:.1f})")
+            lines.append(f"{team.name}: {worst_player.name} (Value: {value:.1f})")
+    console.print("\n".join(lines))
     
     # Test the draft
     console.print("\n[yellow]Running 1-round draft...[/yellow]")
@@ -84,15 +101,17 @@ def test_draft_direct():
         console.print("\n[green]✓ Draft completed successfully![/green]")
         
         # Verify rosters after draft
-        console.print("\nRosters after draft:")
+        lines = ["\nRosters after draft:"]
         for team in teams:
-            players = team.get_all_players()
-            console.print(f"{team.name}: {len(players)} players")
+            player_count = len(team.active_roster) + len(team.reserve_roster)
+            lines.append(f"{team.name}: {player_count} players")
+        console.print("\n".join(lines))
             
     except Exception as e:
         console.print(f"[red]✗ Draft failed: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        if os.getenv("WBM_VERBOSE_ERRORS"):
+            import traceback
+            traceback.print_exc()
 
 if __name__ == "__main__":
     test_draft_direct()
\ No newline at end of file
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
 Comprehensive test for all Wiffle Ball Manager enhancements
+
+The UI test pauses between screens when run from a terminal; set WBM_BATCH=1
+(or run without a terminal on stdin, as under pytest) to skip the pauses.
 """
 
 import sys
@@ -16,13 +19,23 @@ from simulation.player_dev import PlayerDevelopment
 from simulation.trading import TradingSystem, TradeOffer
 from simulation.mlw_rules import MLWRules
 from ui.team_management import TeamManagementUI
+import numpy as np
 import random
 
+def _pause():
+    """Wait for Enter between screens, unless running in batch mode"""
+    if sys.stdin.isatty() and not os.getenv("WBM_BATCH"):
+        input("Press Enter to continue...")
+
 def create_enhanced_test_teams():
     """Create test teams with realistic players for demonstration."""
     teams = []
     team_names = ["Thunder", "Lightning", "Storm", "Hurricane", "Tornado", "Cyclone"]
     
+    # Each group's ages and ratings come from one draw per team; the columns are
+    # age, velocity, control, stamina and speed_control
+    rng = np.random.default_rng()
+    
     for i, name in enumerate(team_names):
         team = Team(name=name, division="Test")
         
@@ -30,43 +43,47 @@ def create_enhanced_test_teams():
         players = []
         
         # Add some veterans (older players)
-        for j in range(2):
+        veterans = rng.integers([28, 60, 60, 50, 60], [35, 80, 80, 70, 80], size=(2, 5), endpoint=True).tolist()
+        veteran_stats = rng.integers([15, 50, 10, 5], [25, 80, 20, 15], size=(2, 4), endpoint=True).tolist()
+        for j, ((age, velocity, control, stamina, speed_control), (h, ab, ip, er)) in enumerate(zip(veterans, veteran_stats)):
             player = Player(
                 name=f"Veteran {j+1}",
-                age=random.randint(28, 35),
-                velocity=random.randint(60, 80),
-                control=random.randint(60, 80),
-                stamina=random.randint(50, 70),
-                speed_control=random.randint(60, 80)
+                age=age,
+                velocity=velocity,
+                control=control,
+                stamina=stamina,
+                speed_control=speed_control
             )
             # Add some stats
-            player.batting_stats.h = random.randint(15, 25)
-            player.batting_stats.ab = random.randint(50, 80)
-            player.pitching_stats.ip = random.randint(10, 20)
-            player.pitching_stats.er = random.randint(5, 15)
+            player.batting_stats.h = h
+            player.batting_stats.ab = ab
+            player.pitching_stats.ip = ip
+            player.pitching_stats.er = er
             players.append(player)
         
         # Add some young players
-        for j in range(2):
+        young = rng.integers([19, 50, 50, 60, 50], [24, 75, 75, 80, 75], size=(2, 5), endpoint=True).tolist()
+        for j, (age, velocity, control, stamina, speed_control) in enumerate(young):
             player = Player(
                 name=f"Young {j+1}",
-                age=random.randint(19, 24),
-                velocity=random.randint(50, 75),
-                control=random.randint(50, 75),
-                stamina=random.randint(60, 80),
-                speed_control=random.randint(50, 75)
+                age=age,
+                velocity=velocity,
+                control=control,
+                stamina=stamina,
+                speed_control=speed_control
             )
             players.append(player)
         
         # Add some mid-career players
-        for j in range(2):
+        mid_career = rng.integers([25, 55, 55, 55, 55], [27, 80, 80, 75, 80], size=(2, 5), endpoint=True).tolist()
+        for j, (age, velocity, control, stamina, speed_control) in enumerate(mid_career):
             player = Player(
                 name=f"Mid {j+1}",
-                age=random.randint(25, 27),
-                velocity=random.randint(55, 80),
-                control=random.randint(55, 80),
-                stamina=random.randint(55, 75),
-                speed_control=random.randint(55, 80)
+                age=age,
+                velocity=velocity,
+                control=control,
+                stamina=stamina,
+                speed_control=speed_control
             )
             players.append(player)
         
@@ -207,11 +224,11 @@ def test_ui_features():
     
     # Show team overview
     ui.show_team_overview(team)
-    input("Press Enter to continue...")
+    _pause()
     
     # Show roster
     ui.show_roster(team, show_reserves=True)
-    input("Press Enter to continue...")
+    _pause()
 
 def main():
     """Run comprehensive enhancement tests"""
@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
-"""Test the fixed career stats grid that includes current season"""
+"""Test the fixed career stats grid that includes current season
 
+Set WBM_VERBOSE_ERRORS=1 to print the traceback of a failure.
+"""
+
+import os
 import sys
 sys.path.insert(0, './src')
 
 from models.player import Player, BattingStats, PitchingStats, FieldingStats
-from ui.team_management import TeamManagementUI
-from rich.console import Console
-import random
 
 def create_player_with_career_and_current_stats():
     """Create a player with career stats AND current season stats"""
@@ -90,6 +91,10 @@ def create_player_with_career_and_current_stats():
 
 def test_fixed_career_grid():
     """Test the fixed career stats grid with current season included"""
+    # The team UI loads Rich, so both wait for the test to run
+    from ui.team_management import TeamManagementUI
+    from rich.console import Console
+    
     console = Console()
     
     console.print("\n[bold]Testing Fixed Career Stats Grid (With Current Season)[/bold]\n")
@@ -97,20 +102,23 @@ def test_fixed_career_grid():
     # Create player with career and current stats
     player = create_player_with_career_and_current_stats()
     
-    console.print("[green]✓ Created player with career stats and current season stats[/green]")
-    console.print(f"Player: {player.name} (Age {player.age})")
-    console.print(f"Career seasons: {player.seasons_played}")
-    console.print(f"Career BA: {player.career_stats.career_batting.avg:.3f}")
-    console.print(f"Career ERA: {player.career_stats.career_pitching.era:.2f}")
-    console.print(f"Current season BA: {player.batting_stats.avg:.3f}")
-    console.print(f"Current season ERA: {player.pitching_stats.era:.2f}")
-    
-    console.print("\n[yellow]Expected results:[/yellow]")
-    console.print("- Season 1 and Season 2 from career stats")
-    console.print("- Season 3 * (with asterisk) from current stats")
-    console.print("- TOTAL row combining all seasons")
-    
-    console.print("\n[cyan]Displaying career stats grid...[/cyan]\n")
+    # The summary is printed as one block so Rich renders it once
+    console.print("\n".join([
+        "[green]✓ Created player with career stats and current season stats[/green]",
+        f"Player: {player.name} (Age {player.age})",
+        f"Career seasons: {player.seasons_played}",
+        f"Career BA: {player.career_stats.career_batting.avg:.3f}",
+        f"Career ERA: {player.career_stats.career_pitching.era:.2f}",
+        f"Current season BA: {player.batting_stats.avg:.3f}",
+        f"Current season ERA: {player.pitching_stats.era:.2f}",
+        "",
+        "[yellow]Expected results:[/yellow]",
+        "- Season 1 and Season 2 from career stats",
+        "- Season 3 * (with asterisk) from current stats",
+        "- TOTAL row combining all seasons",
+        "",
+        "[cyan]Displaying career stats grid...[/cyan]\n"
+    ]))
     
     try:
         team_ui = TeamManagementUI()
@@ -121,8 +129,9 @@ def test_fixed_career_grid():
         
     except Exception as e:
         console.print(f"[red]✗ Error displaying fixed career stats: {e}[/red]")
-        import traceback
-        traceback.print_exc()
+        if os.getenv("WBM_VERBOSE_ERRORS"):
+            import traceback
+            traceback.print_exc()
 
 if __name__ == "__main__":
     test_fixed_career_grid()
\ No newline at end of file
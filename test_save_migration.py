@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Test script to verify v1.0 -> v2.0 save file migration"""
+
+import sys
+sys.path.insert(0, './src')
+sys.path.insert(0, '.')
+
+import json
+import os
+import random
+import tempfile
+from src.utils.migration import SaveFileMigrator
+
+def create_v1_save(path, teams=2, players_per_team=3):
+    """Write a small v1.0 save file"""
+    data = {
+        "game_version": "1.0",
+        "current_season": 2,
+        "teams": [
+            {
+                "name": f"Team {t}",
+                "players": [
+                    {
+                        "name": f"Player {t}-{p}",
+                        "power": 120 if p == 0 else 40 + p,  # Out of range power gets clamped
+                        "leadership": 60,
+                        "batting_stats": {"ab": 10, "h": 3},
+                        "pitching_stats": {},
+                        "fielding_stats": {"po": 2}
+                    }
+                    for p in range(players_per_team)
+                ]
+            }
+            for t in range(teams)
+        ]
+    }
+    with open(path, "w") as f:
+        json.dump(data, f)
+    return data
+
+def test_migrate_directory_round_trip():
+    """Migrated saves are written as valid v2.0 files with the new player fields"""
+    with tempfile.TemporaryDirectory() as tmp:
+        input_dir = os.path.join(tmp, "v1")
+        os.makedirs(input_dir)
+        for i in range(3):
+            create_v1_save(os.path.join(input_dir, f"save_{i}.json"))
+
+        migrator = SaveFileMigrator(os.path.join(tmp, "saves"))
+        migrated = migrator.migrate_directory(input_dir, os.path.join(tmp, "v2"))
+        assert len(migrated) == 3
+
+        for path in migrated:
+            assert migrator.validate_v2_save(path), f"{path} should validate as v2.0"
+            with open(path) as f:
+                data = json.load(f)
+            assert data["game_version"] == "2.0"
+            assert data["current_season"] == 2
+            player = data["teams"][0]["players"][0]
+            assert player["power"] == 100
+            assert 1 <= player["clutch"] <= 100 and 1 <= player["composure"] <= 100
+            assert player["batting_stats"]["ab"] == 10 and player["batting_stats"]["hr"] == 0
+            assert player["fielding_stats"]["po"] == 2 and player["fielding_stats"]["fpct"] == 1.0
+            assert set(player["career_stats"]) == {
+                "season_batting", "season_pitching", "season_fielding",
+                "career_batting", "career_pitching", "career_fielding"
+            }
+
+    print("✓ Directory migration writes valid v2.0 saves")
+
+def test_migrate_large_directory_in_parallel():
+    """Larger directories are migrated by worker processes; bad files are reported, not fatal"""
+    with tempfile.TemporaryDirectory() as tmp:
+        input_dir = os.path.join(tmp, "v1")
+        os.makedirs(input_dir)
+        for i in range(8):
+            create_v1_save(os.path.join(input_dir, f"save_{i}.json"), teams=3)
+        with open(os.path.join(input_dir, "broken.json"), "w") as f:
+            f.write("{not json")
+
+        migrator = SaveFileMigrator(os.path.join(tmp, "saves"))
+        migrated = migrator.migrate_directory(input_dir, os.path.join(tmp, "v2"))
+        assert sorted(os.path.basename(path) for path in migrated) == [f"save_{i}.json" for i in range(8)]
+        assert all(migrator.validate_v2_save(path) for path in migrated)
+
+    print("✓ Large directories migrate in parallel and skip unreadable files")
+
+def test_validate_rejects_v1_save():
+    """An unmigrated v1.0 save does not validate as v2.0"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "old.json")
+        create_v1_save(path)
+        migrator = SaveFileMigrator(os.path.join(tmp, "saves"))
+        assert not migrator.validate_v2_save(path)
+
+    print("✓ v1.0 saves fail v2.0 validation")
+
+def test_repeat_backups_are_numbered():
+    """Backing up the same file twice keeps both copies"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "league.json")
+        create_v1_save(path)
+        migrator = SaveFileMigrator(os.path.join(tmp, "saves"))
+
+        first = migrator._create_backup(path)
+        second = migrator._create_backup(path)
+        assert first != second
+        assert os.path.exists(first) and os.path.exists(second)
+
+    print("✓ Repeat backups of one file are kept side by side")
+
+def test_directory_migration_backups():
+    """A separate output directory leaves the originals in place without backup copies"""
+    with tempfile.TemporaryDirectory() as tmp:
+        input_dir = os.path.join(tmp, "v1")
+        os.makedirs(input_dir)
+        for i in range(5):
+            create_v1_save(os.path.join(input_dir, f"save_{i}.json"))
+        migrator = SaveFileMigrator(os.path.join(tmp, "saves"))
+
+        migrator.migrate_directory(input_dir, os.path.join(tmp, "v2"))
+        assert os.listdir(migrator.backup_dir) == []
+        with open(os.path.join(input_dir, "save_0.json")) as f:
+            assert json.load(f)["game_version"] == "1.0"
+
+        migrator.migrate_directory(input_dir, input_dir)
+        backups = os.listdir(migrator.backup_dir)
+        assert len(backups) == 5, "Migrating in place should back up the originals"
+        # "save_0_backup_<timestamp>.json": one run shares one timestamp
+        assert len({name.split("_backup_")[1] for name in backups}) == 1
+
+    print("✓ Directory migration backs up only files it overwrites, under one timestamp")
+
+def test_seeded_directory_migration_is_reproducible():
+    """random.seed() fixes the migrated players' random defaults, even across worker processes"""
+    with tempfile.TemporaryDirectory() as tmp:
+        input_dir = os.path.join(tmp, "v1")
+        os.makedirs(input_dir)
+        for i in range(5):
+            create_v1_save(os.path.join(input_dir, f"save_{i}.json"))
+        migrator = SaveFileMigrator(os.path.join(tmp, "saves"))
+
+        def migrated_players(output_dir):
+            random.seed(2024)
+            players = []
+            for path in sorted(migrator.migrate_directory(input_dir, output_dir)):
+                with open(path) as f:
+                    data = json.load(f)
+                players.append([(p["clutch"], p["composure"], p["height"], p["weight"])
+                                for team in data["teams"] for p in team["players"]])
+            return players
+
+        first = migrated_players(os.path.join(tmp, "a"))
+        assert first == migrated_players(os.path.join(tmp, "b"))
+        assert len({tuple(players) for players in first}) > 1, "Each file should get its own draws"
+
+    print("✓ Seeded directory migrations are reproducible")
+
+if __name__ == "__main__":
+    test_migrate_directory_round_trip()
+    test_migrate_large_directory_in_parallel()
+    test_validate_rejects_v1_save()
+    test_repeat_backups_are_numbered()
+    test_directory_migration_backups()
+    test_seeded_directory_migration_is_reproducible()
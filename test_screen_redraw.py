@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Test script to verify team screens redraw and reuse their built tables"""
+
+import sys
+sys.path.insert(0, './src')
+
+import io
+from rich.console import Console
+from models.player import Player
+from models.team import Team
+from ui.team_management import TeamManagementUI
+
+def create_team():
+    """Create a small team with a few players"""
+    team = Team(name="Redraw Test", division="East", wins=3, losses=2)
+    for i in range(6):
+        team.add_player(Player(name=f"Player {i}"), active=True)
+    return team
+
+def test_repeated_screens_are_redrawn():
+    """Showing a screen again always draws it, since other output may have covered it"""
+    console = Console(record=True, width=140, file=io.StringIO())
+    ui = TeamManagementUI(console=console)
+    team = create_team()
+
+    ui.show_roster(team)
+    first = console.export_text()
+    assert "Player 5" in first
+
+    ui.show_roster(team)
+    assert console.export_text() == first, "Unchanged roster should be drawn the same again"
+
+    team.active_roster[0].batting_stats.ab = 4
+    team.active_roster[0].batting_stats.h = 2
+    ui.show_roster(team)
+    assert "0.500" in console.export_text(), "Changed stats should show in the roster"
+
+    ui.show_team_overview(team)
+    ui.show_team_overview(team)
+    assert console.export_text().count("Season Stats") == 2
+
+    print("✓ Repeated screens are drawn again")
+
+def test_team_screen_draws_overview_and_roster_together():
+    """The combined team screen shows the overview and the roster in one draw"""
+    console = Console(record=True, width=140, file=io.StringIO())
+    ui = TeamManagementUI(console=console)
+    team = create_team()
+
+    ui.show_team_screen(team)
+    output = console.export_text()
+    assert "Season Stats" in output and "Redraw Test Roster" in output
+
+
+    print("✓ Team screen draws overview and roster together")
+
+def test_redraw_reuses_built_tables():
+    """Redrawing an unchanged screen after other output reuses its built roster table"""
+    console = Console(record=True, width=140, file=io.StringIO())
+    ui = TeamManagementUI(console=console)
+    team = create_team()
+
+    ui.show_roster(team)
+    first = console.export_text()
+    table = ui._screen_parts["roster"][1][0]
+
+    ui.show_current_season_stats(team.active_roster[0])
+    console.export_text()
+    ui.show_roster(team)
+    assert console.export_text() == first, "Redraw should look the same"
+    assert ui._screen_parts["roster"][1][0] is table, "Unchanged roster should reuse its table"
+
+    team.active_roster[0].batting_stats.ab = 3
+    ui.show_roster(team)
+    assert ui._screen_parts["roster"][1][0] is not table, "Changed roster should rebuild its table"
+
+    print("✓ Redraws reuse tables built for unchanged screens")
+
+if __name__ == "__main__":
+    test_repeated_screens_are_redrawn()
+    test_team_screen_draws_overview_and_roster_together()
+    test_redraw_reuses_built_tables()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Test script to verify stat leader selection matches a full sort"""
+
+import sys
+sys.path.insert(0, './src')
+
+import random
+import numpy as np
+from models.player import Player
+from models.team import Team
+from ui._stat_kernels import top_n_desc, top_n_asc, standings_order, StatIndex
+
+def test_top_n_matches_sorted():
+    """top_n_desc/top_n_asc should pick the same players, in the same order, as sorted()[:n]"""
+    rng = random.Random(42)
+    
+    for trial in range(500):
+        # Mostly league-sized inputs, plus some large enough for the argpartition path
+        count = rng.randint(0, 40) if trial % 5 else rng.randint(500, 1500)
+        values = [rng.randint(0, 6) for _ in range(count)]  # Small range forces plenty of ties
+        if trial % 2:
+            values = [v / 7 for v in values]
+        array = np.array(values, dtype=np.float64)
+        
+        expected_desc = sorted(range(count), key=lambda i: values[i], reverse=True)[:10]
+        expected_asc = sorted(range(count), key=lambda i: values[i])[:10]
+        
+        assert list(top_n_desc(array)) == expected_desc, f"desc mismatch for {values}"
+        assert list(top_n_asc(array)) == expected_asc, f"asc mismatch for {values}"
+    
+    print("✓ Top-N leader selection matches sorted() ordering, including ties")
+
+def test_stat_index_leaders():
+    """StatIndex leaders should match filtering and sorting the Player objects directly"""
+    rng = random.Random(7)
+    teams = []
+    for t in range(4):
+        team = Team(name=f"Team {t}")
+        for i in range(8):
+            player = Player(name=f"Player {t}-{i}")
+            player.batting_stats.ab = rng.randint(0, 40)
+            player.batting_stats.h = rng.randint(0, player.batting_stats.ab)
+            player.batting_stats.hr = rng.randint(0, 5)
+            player.pitching_stats.ip = float(rng.randint(0, 12))
+            player.pitching_stats.er = rng.randint(0, 8)
+            player.fielding_stats.po = rng.randint(0, 6)
+            player.fielding_stats.a = rng.randint(0, 4)
+            player.fielding_stats.e = rng.randint(0, 2)
+            team.add_player(player, active=i < 6)
+        teams.append(team)
+    
+    stats = StatIndex.from_teams(teams)
+    all_players = [p for team in teams for p in team.active_roster + team.reserve_roster]
+    assert stats.players == all_players
+    
+    batters = [p for p in all_players if p.batting_stats.ab > 0]
+    pitchers = [p for p in all_players if p.pitching_stats.ip > 0]
+    expected_avg = sorted(batters, key=lambda p: p.batting_stats.avg, reverse=True)[:10]
+    expected_era = sorted(pitchers, key=lambda p: p.pitching_stats.era)[:10]
+    
+    def leaders(values, mask, descending=True):
+        return [stats.players[i] for i in stats.leader_rows(values, mask, descending=descending)]
+    
+    assert leaders(stats.avg, stats.ab > 0) == expected_avg
+    assert leaders(stats.era, stats.ip > 0, descending=False) == expected_era
+    
+    fielders = [p for p in all_players if p.fielding_stats.po + p.fielding_stats.a + p.fielding_stats.e >= 5]
+    expected_fpct = sorted(fielders, key=lambda p: p.fielding_stats.calc_fpct, reverse=True)[:10]
+    assert leaders(stats.fpct, stats.chances >= 5) == expected_fpct
+    assert stats.fpct_text() == [f"{p.fielding_stats.calc_fpct:.3f}" for p in all_players]
+    
+    print("✓ StatIndex leaders match per-player sorting")
+    
+    # Leader rows format the same text the player stats would
+    rows = stats.leader_rows(stats.avg, stats.ab > 0)
+    assert [stats.players[i] for i in rows] == expected_avg
+    assert stats.avg_text(rows) == [f"{p.batting_stats.avg:.3f}" for p in expected_avg]
+    assert stats.avg_text() == [f"{p.batting_stats.avg:.3f}" if p.batting_stats.ab > 0 else "N/A" for p in all_players]
+    
+    print("✓ StatIndex leader rows format their selected columns")
+
+def test_standings_order_by_pct():
+    """Standings should order like sorted() on (PCT, wins, run differential), highest first"""
+    rng = random.Random(11)
+    
+    for trial in range(200):
+        teams = [
+            Team(name=f"Team {i}", wins=rng.randint(0, 4), losses=rng.randint(0, 4), ties=rng.randint(0, 1),
+                 runs_scored=rng.randint(0, 6), runs_allowed=rng.randint(0, 6))
+            for i in range(rng.randint(0, 10))
+        ]
+        expected = sorted(
+            range(len(teams)), key=lambda i: (teams[i].pct, teams[i].wins, teams[i].run_differential), reverse=True
+        )
+        order, pct_text = standings_order(teams)
+        assert order == expected, f"order mismatch for trial {trial}"
+        assert pct_text == [f"{team.pct:.3f}" for team in teams]
+    
+    print("✓ Standings order by PCT, then wins, then run differential")
+
+if __name__ == "__main__":
+    test_top_n_matches_sorted()
+    test_stat_index_leaders()
+    test_standings_order_by_pct()